@@ -0,0 +1,30 @@
+"""Optional numba support for PyQt Live Tuner.
+
+Kernels decorated with njit are compiled when numba is installed, and run as
+plain Python otherwise.
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+def warm_up(kernel, *args):
+    """Compile a kernel now rather than on its first real call.
+
+    Does nothing without numba, where there is no compile cost to move.
+
+    Args:
+        kernel: Function decorated with njit
+        *args: Sample arguments with the types the kernel is called with
+    """
+    if HAS_NUMBA:
+        kernel(*args)
@@ -45,7 +45,7 @@ class FileHandler:
             self._last_save_path = path
             return path
         except Exception as e:
-            logger.error(f"Error saving configuration: {e}")
+            logger.error("Error saving configuration: %s", e)
             return None
             
     def load_config(self, file_path: str) -> Optional[Dict[str, Any]]:
@@ -65,7 +65,7 @@ class FileHandler:
                 data = json.load(f)
             return data
         except Exception as e:
-            logger.error(f"Error loading configuration: {e}")
+            logger.error("Error loading configuration: %s", e)
             return None
             
     def get_save_path(self) -> str:
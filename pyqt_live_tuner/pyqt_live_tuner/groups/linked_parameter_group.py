@@ -10,7 +10,7 @@ from typing import Callable, Dict, Any
 from .parameter_group import BaseParameterGroup
 from ..parameters.parameter import Parameter
 
-from typing import Any, Dict, Optional, Callable, List, Literal
+from typing import Any, Dict, Optional, Callable, List, Literal, Iterator
 
 
 class LinkedParameterGroup(BaseParameterGroup):
@@ -45,17 +45,30 @@ class LinkedParameterGroup(BaseParameterGroup):
         self._parameters[param.name] = param
         self.layout.addWidget(param)
         
-        # Connect the parameter's valueChanged signal to our handler
-        param.valueChanged.connect(self._on_any_value_changed)
+        # Register as a direct callback rather than through valueChanged, so
+        # parameter changes reach the group without a Qt signal dispatch
+        param.register_callback(self._on_any_value_changed)
 
     def add_parameters(self, params: List[Parameter]) -> None:
         """Add multiple parameters to the group.
         
+        The layout is disabled while inserting so geometry is recomputed
+        once for the whole batch rather than once per parameter.
+        
         Args:
             params: List of parameters to add
         """
-        for param in params:
-            self.add_parameter(param)
+        add_parameter = self.add_parameter
+        self.layout.setEnabled(False)
+        try:
+            for param in params:
+                add_parameter(param)
+        finally:
+            self.layout.setEnabled(True)
+
+    def __iter__(self) -> Iterator[Parameter]:
+        """Iterate over the parameters in insertion order."""
+        return iter(self._parameters.values())
 
     def _on_any_value_changed(self, *_):
         """Handle when any parameter in the group changes.
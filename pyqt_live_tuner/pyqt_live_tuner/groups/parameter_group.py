@@ -10,7 +10,8 @@ from typing import Dict, Any, List, Optional
 from ..parameters.parameter import Parameter
 from PyQt5.QtWidgets import QHBoxLayout
 
-from typing import Any, Dict, Optional, Callable, List, Literal
+from typing import Any, Dict, Optional, Callable, List, Literal, Iterator
+
 
 class BaseParameterGroup(QGroupBox):
     """Base class for parameter groups in PyQt Live Tuner.
@@ -108,11 +109,23 @@ class ParameterGroup(BaseParameterGroup):
     def add_parameters(self, params: List[Parameter]) -> None:
         """Add multiple parameters to the group.
         
+        The layout is disabled while inserting so geometry is recomputed
+        once for the whole batch rather than once per parameter.
+        
         Args:
             params: List of parameters to add
         """
-        for param in params:
-            self.add_parameter(param)
+        add_parameter = self.add_parameter
+        self.layout.setEnabled(False)
+        try:
+            for param in params:
+                add_parameter(param)
+        finally:
+            self.layout.setEnabled(True)
+
+    def __iter__(self) -> Iterator[Parameter]:
+        """Iterate over the parameters in insertion order."""
+        return iter(self._parameters.values())
 
     def get_values(self) -> Dict[str, Any]:
         """Get the values of all parameters in the group.
@@ -120,20 +133,23 @@ class ParameterGroup(BaseParameterGroup):
         Returns:
             Dictionary of parameter values
         """
-        values = {}
-        for name, param in self._parameters.items():
-            values[name] = param.get_value()
-        return values
+        return {name: param.get_value() for name, param in self._parameters.items()}
 
     def set_values(self, values: Dict[str, Any]) -> None:
         """Set the values of parameters in the group.
         
         Args:
             values: Dictionary of parameter values
+            
+        Raises:
+            ValueError: If any name in values is not a parameter of this group
         """
+        parameters = self._parameters
+        missing = values.keys() - parameters.keys()
+        if missing:
+            names = ", ".join(sorted(missing))
+            raise ValueError(f"Parameter(s) {names} not found in group '{self._name}'")
+            
         for name, value in values.items():
-            if name in self._parameters:
-                self._parameters[name].set_value(value)
-        else:
-            raise ValueError(f"Parameter '{name}' not found in group '{self._name}'")
+            parameters[name].set_value(value)
         
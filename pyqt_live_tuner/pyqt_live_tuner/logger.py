@@ -9,9 +9,9 @@ logger.setLevel(logging.DEBUG)  # Default to DEBUG; can be overridden
 console_handler = logging.StreamHandler()
 console_handler.setLevel(os.getenv("LOG_LEVEL_CONSOLE", "INFO").upper())
 
-# File handler
+# File handler (delay=True defers opening the file until the first record)
 log_file = os.getenv("LOG_FILE", "camera_tuner.log")
-file_handler = logging.FileHandler(log_file)
+file_handler = logging.FileHandler(log_file, delay=True)
 file_handler.setLevel(os.getenv("LOG_LEVEL_FILE", "DEBUG").upper())
 
 # Log format
@@ -25,6 +25,3 @@ file_handler.setFormatter(formatter)
 if not logger.handlers:
     logger.addHandler(console_handler)
     logger.addHandler(file_handler)
-
-logger.info("Logger initialized. Console level: %s, File level: %s", 
-            console_handler.level, file_handler.level)
@@ -5,12 +5,14 @@ as the primary window for PyQt Live Tuner applications. It handles parameter pan
 configuration panels, and menu functionality for saving and loading configurations.
 """
 
+from dataclasses import dataclass
+
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QGridLayout, QLabel, QFileDialog, QAction, QMenuBar, QMessageBox
 )
 from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import Qt
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Tuple, Iterable
 
 from .panels.parameter_panel import ParameterPanel
 from .panels.config_panel import ConfigPanel
@@ -20,6 +22,24 @@ from .file_handler import FileHandler
 from .logger import logger
 
 
+@dataclass
+class PanelEntry:
+    """Record describing a panel placed in the main window grid.
+    
+    Attributes:
+        widget (QWidget): The panel widget
+        row_span (int): Number of rows the panel spans
+        col_span (int): Number of columns the panel spans
+        name (Optional[str]): Label text shown above the panel, if any
+    """
+    __slots__ = ('widget', 'row_span', 'col_span', 'name')
+
+    widget: QWidget
+    row_span: int
+    col_span: int
+    name: Optional[str]
+
+
 class MainWindow(QMainWindow):
     """Main window for PyQt Live Tuner applications.
     
@@ -32,7 +52,8 @@ class MainWindow(QMainWindow):
         _config_panel (ConfigPanel): Container for configuration widgets
         layout (QGridLayout): Main grid layout for the window
         _file_handler (FileHandler): Handler for file operations
-        _panels (Dict): Dictionary tracking panels by position
+        _panels (Dict[Tuple[int, int], PanelEntry]): Panels tracked by grid position
+        _panel_labels (Dict): Name labels keyed by grid position, reused across calls
     """
     
     def __init__(
@@ -58,7 +79,8 @@ class MainWindow(QMainWindow):
         central_widget.setLayout(self.layout)
 
         # Panel tracking
-        self._panels = {}  # Dictionary to track panels by position
+        self._panels: Dict[Tuple[int, int], PanelEntry] = {}  # Panels tracked by position
+        self._panel_labels: Dict[Tuple[int, int], QLabel] = {}
 
 
         # Menu
@@ -104,14 +126,54 @@ class MainWindow(QMainWindow):
         Returns:
             The position where the panel was placed
         """
-        row, col = position
+        self.setUpdatesEnabled(False)
+        try:
+            return self._add_panel(panel, position, name, row_span, col_span, alignment)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def add_panels(self, panels: Iterable[Tuple]) -> list:
+        """Add several panels with a single relayout and repaint.
         
+        Args:
+            panels: Iterable of argument tuples, each matching the
+                positional signature of add_panel()
+        
+        Returns:
+            List of the positions where the panels were placed
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            positions = [self._add_panel(*args) for args in panels]
+        finally:
+            self.setUpdatesEnabled(True)
+        return positions
+
+    def _add_panel(self, panel: QWidget, position: Tuple[int, int], name: Optional[str] = None,
+                   row_span: int = 1, col_span: int = 1, alignment: Optional[int] = None):
+        """Place a panel in the grid without toggling window updates.
+        
+        See add_panel() for the meaning of the arguments.
+        """
+        row, col = position
         
-        # Add label if provided
+        # Add label if provided, reusing the one already placed at this position
+        label = self._panel_labels.get((row, col))
         if name:
-            label = QLabel(name)
+            if label is None:
+                label = QLabel(name)
+                self._panel_labels[(row, col)] = label
+            else:
+                label.setText(name)
+                # Re-place it, since the span may differ from the last call
+                self.layout.removeWidget(label)
             self.layout.addWidget(label, row, col, 1, col_span)
             row += 1  # Place panel below the label
+        elif label is not None:
+            # The panel at this position no longer has a label
+            del self._panel_labels[(row, col)]
+            self.layout.removeWidget(label)
+            label.deleteLater()
         
         # Add the panel
         if alignment:
@@ -121,11 +183,6 @@ class MainWindow(QMainWindow):
         
         # Track the panel
         panel_position = (row, col)
-        self._panels[panel_position] = {
-            'widget': panel,
-            'row_span': row_span,
-            'col_span': col_span,
-            'name': name
-        }
+        self._panels[panel_position] = PanelEntry(panel, row_span, col_span, name)
         
         return panel_position
@@ -59,11 +59,14 @@ class ConfigPanel(QFrame):
         
     def clear(self) -> None:
         """Remove all widgets from the panel."""
-        # Remove all widgets from layout
-        while self.layout.count():
-            item = self.layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Remove all widgets from layout, taking from the end so the layout
+        # doesn't shift its remaining items on every removal
+        layout = self.layout
+        take = layout.takeAt
+        for index in range(layout.count() - 1, -1, -1):
+            widget = take(index).widget()
+            if widget is not None:
+                widget.deleteLater()
                 
         # Clear widget list
         self.widgets.clear()
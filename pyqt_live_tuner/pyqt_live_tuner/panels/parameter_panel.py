@@ -4,7 +4,8 @@ This module provides the ParameterPanel class (formerly ParametersContainer),
 which serves as a container for parameter widgets and groups.
 """
 
-from PyQt5.QtWidgets import QScrollArea, QWidget, QVBoxLayout, QFrame
+from PyQt5.QtWidgets import QScrollArea, QWidget, QVBoxLayout
+from PyQt5.QtCore import Qt
 from typing import Dict, List, Any, Optional
 
 from ..parameters.parameter import Parameter
@@ -32,6 +33,11 @@ class ParameterPanel(QScrollArea):
         
         # Create container widget and layout
         self.container = QWidget()
+        # Parameters are framed by a container-level style rule instead of
+        # wrapping each one in its own QFrame, keeping the widget tree shallow
+        self.container.setStyleSheet(
+            "Parameter { border: 1px solid palette(mid); border-radius: 2px; }"
+        )
         self.layout = QVBoxLayout()
         # self.layout.setContentsMargins(10, 10, 10, 10)
         # self.layout.setSpacing(8)
@@ -56,19 +62,11 @@ class ParameterPanel(QScrollArea):
         # Store the parameter
         self.widgets[param.name] = param
         
-        # Create a frame for visual separation
-        frame = QFrame()
-        frame.setFrameShape(QFrame.StyledPanel)
-        frame.setLineWidth(1)
+        # Let the container style sheet draw the separating border
+        param.setAttribute(Qt.WA_StyledBackground, True)
         
-        # Add parameter to frame layout
-        frame_layout = QVBoxLayout()
-        # frame_layout.setContentsMargins(5, 5, 5, 5)
-        frame_layout.addWidget(param)
-        frame.setLayout(frame_layout)
-        
-        # Add frame to panel
-        self.layout.addWidget(frame)
+        # Add parameter to panel
+        self.layout.addWidget(param)
         
     def add_group(self, group: ParameterGroup) -> None:
         """Add a parameter group to the panel.
@@ -85,11 +83,8 @@ class ParameterPanel(QScrollArea):
         Returns:
             Dictionary of parameter and group values
         """
-        values = {}
-        
         # Collect individual parameter values
-        for name, widget in self.widgets.items():
-            values[name] = widget.get_value()
+        values = {name: widget.get_value() for name, widget in self.widgets.items()}
             
         # Collect parameter group values
         for group in self.groups:
@@ -100,16 +95,23 @@ class ParameterPanel(QScrollArea):
     def set_values(self, values: Dict[str, Any]) -> None:
         """Set the values of parameters and groups.
         
+        Painting is suspended while the values are applied, so the repaints
+        they cause are merged into one.
+        
         Args:
             values: Dictionary of parameter and group values
         """
-        # Update individual parameters
-        for name, value in values.items():
-            if name in self.widgets:
-                self.widgets[name].set_value(value)
-                
-        # Update parameter groups
-        for group in self.groups:
-            title = group.title()
-            if title in values:
-                group.set_values(values[title])
+        self.setUpdatesEnabled(False)
+        try:
+            # Update individual parameters
+            for name, value in values.items():
+                if name in self.widgets:
+                    self.widgets[name].set_value(value)
+                    
+            # Update parameter groups
+            for group in self.groups:
+                title = group.title()
+                if title in values:
+                    group.set_values(values[title])
+        finally:
+            self.setUpdatesEnabled(True)
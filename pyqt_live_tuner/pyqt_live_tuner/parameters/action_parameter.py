@@ -1,5 +1,5 @@
 from PyQt5.QtWidgets import QPushButton
-from typing import Callable, Optional
+from typing import Optional
 
 from .parameter import Parameter
 
@@ -26,8 +26,8 @@ class ActionParameter(Parameter):
         super().__init__(name, config)
         config = config or {}
 
-        # Hide the label from the base class as we'll use the button text instead
-        self.label.hide()
+        # The button text shows the name, so the base class label is never built
+        self.show_label = False
         
         # Create button with parameter name as text
         self.button = QPushButton(self.name)
@@ -38,15 +38,15 @@ class ActionParameter(Parameter):
         if self._action and callable(self._action):
             self.register_callback(self._action)
 
-        # Add to existing layout from base class
-        self.layout.addWidget(self.button)
+        # Add to the content layout from the base class
+        self.working_layout.addWidget(self.button)
 
     def on_clicked(self) -> None:
         """Handle button click events.
         
         Emits the valueChanged signal with the parameter name and None as value.
         """
-        self.valueChanged.emit(self.name, None)
+        self._emit_value(None)
 
     def set_value(self, value) -> None:
         """Set the parameter value (no-op for action parameters).
@@ -67,12 +67,3 @@ class ActionParameter(Parameter):
             None
         """
         return None
-
-    def register_callback(self, callback: Callable[[str, None], None]) -> None:
-        """Register a callback to be called when the button is clicked.
-        
-        Args:
-            callback: Function to call when clicked, with signature:
-                     callback(parameter_name, None)
-        """
-        self.valueChanged.connect(callback)
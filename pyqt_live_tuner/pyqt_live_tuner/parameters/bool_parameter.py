@@ -1,5 +1,6 @@
 from PyQt5.QtWidgets import QCheckBox
-from typing import Callable, Optional
+from PyQt5.QtCore import QSignalBlocker
+from typing import Optional
 
 from .parameter import Parameter
 
@@ -34,8 +35,8 @@ class BoolParameter(Parameter):
         self.checkbox.setChecked(self.value)
         self.checkbox.stateChanged.connect(self.on_toggle)
 
-        # Add to existing layout from base class
-        self.layout.addWidget(self.checkbox)
+        # Add to the content layout from the base class
+        self.working_layout.addWidget(self.checkbox)
 
     def on_toggle(self, state: int) -> None:
         """Handle checkbox state changes.
@@ -48,7 +49,7 @@ class BoolParameter(Parameter):
         checked = bool(state)
         if checked != self.value:
             self.value = checked
-            self.valueChanged.emit(self.name, self.value)
+            self._emit_value(checked)
 
     def set_value(self, value: bool) -> None:
         """Set the parameter value programmatically.
@@ -58,10 +59,12 @@ class BoolParameter(Parameter):
         Args:
             value: The new boolean value to set
         """
-        if bool(value) != self.value:
-            self.value = bool(value)
-            self.checkbox.setChecked(self.value)
-            self.valueChanged.emit(self.name, self.value)
+        value = bool(value)
+        if value != self.value:
+            self.value = value
+            with QSignalBlocker(self.checkbox):
+                self.checkbox.setChecked(value)
+            self._emit_value(value)
 
     def get_value(self) -> bool:
         """Get the current parameter value.
@@ -70,12 +73,3 @@ class BoolParameter(Parameter):
             The current boolean value of the parameter
         """
         return self.value
-
-    def register_callback(self, callback: Callable[[str, bool], None]) -> None:
-        """Register a callback to be called when the value changes.
-        
-        Args:
-            callback: Function to call when value changes, with signature:
-                     callback(parameter_name, parameter_value)
-        """
-        self.valueChanged.connect(callback)
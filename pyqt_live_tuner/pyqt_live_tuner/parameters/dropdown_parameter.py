@@ -7,7 +7,7 @@ which implements a dropdown selection parameter widget.
 from typing import List, Dict, Any, Optional
 
 from PyQt5.QtWidgets import QComboBox
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QSignalBlocker
 
 from .parameter import Parameter
 
@@ -45,7 +45,7 @@ class DropdownParameter(Parameter):
         self.dropdown = QComboBox()
         self.dropdown.setEditable(False)
         self.dropdown.setPlaceholderText(self.placeholder)
-        self.layout.addWidget(self.dropdown)
+        self.working_layout.addWidget(self.dropdown)
         
         # Add placeholder and options
         self.dropdown.addItem(self.placeholder)
@@ -71,17 +71,18 @@ class DropdownParameter(Parameter):
             return
             
         self.value = text
-        self.valueChanged.emit(self.name, self.value)
+        self._emit_value(text)
     
     def get_value(self) -> str:
         """Get the current value of the parameter.
         
+        The value is tracked on every selection change, so no query of the
+        underlying combo box is needed.
+        
         Returns:
             The currently selected option, or empty string if none selected
         """
-        if self.dropdown.currentText() == self.placeholder:
-            return ""
-        return self.dropdown.currentText()
+        return self.value
     
     def set_value(self, value: str) -> None:
         """Set the value of the parameter.
@@ -99,7 +100,8 @@ class DropdownParameter(Parameter):
         for i in range(self.dropdown.count()):
             if self.dropdown.itemText(i) == value:
                 self.dropdown.setCurrentIndex(i)
-                self.value = value
+                # Selecting the placeholder means nothing is selected
+                self.value = "" if value == self.placeholder else value
                 found = True
                 break
                 
@@ -112,6 +114,9 @@ class DropdownParameter(Parameter):
     def update_options(self, options: List[str], initial: Optional[str] = None) -> None:
         """Update the available options in the dropdown.
         
+        Dropdown signals are blocked while it is repopulated, and a single
+        valueChanged is emitted afterwards if the selection changed.
+        
         Args:
             options: New list of available options
             initial: Optional initial value to set after updating options
@@ -122,17 +127,23 @@ class DropdownParameter(Parameter):
         # Update options list
         self.options = options
         
-        # Clear and repopulate dropdown
-        self.dropdown.clear()
-        self.dropdown.addItem(self.placeholder)
-        for option in self.options:
-            self.dropdown.addItem(option)
+        with QSignalBlocker(self.dropdown):
+            # Clear and repopulate dropdown
+            self.dropdown.clear()
+            self.dropdown.addItem(self.placeholder)
+            for option in self.options:
+                self.dropdown.addItem(option)
+            
+            # The dropdown now shows the placeholder
+            self.value = ""
             
-        # Set initial value or restore previous value if it's still valid
-        if initial is not None and initial in self.options:
-            self.set_value(initial)
-        elif current in self.options:
-            self.set_value(current)
-        else:
-            self.dropdown.setCurrentIndex(0)  # Select placeholder
-            self.value = ""
\ No newline at end of file
+            # Set initial value or restore previous value if it's still valid
+            if initial is not None and initial in self.options:
+                self.set_value(initial)
+            elif current in self.options:
+                self.set_value(current)
+            else:
+                self.dropdown.setCurrentIndex(0)  # Select placeholder
+        
+        if self.value != current:
+            self._emit_value(self.value)
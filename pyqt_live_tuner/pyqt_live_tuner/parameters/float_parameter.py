@@ -58,12 +58,12 @@ class FloatParameter(Parameter):
         self.adjust_button.setToolTip("Adjust min, max, step")
         self.adjust_button.clicked.connect(self._open_adjust_dialog)
 
-        layout = self.layout
-        layout.addWidget(self.slider)
-        layout.addWidget(self.spinbox)
-        layout.addWidget(self.adjust_button)
+        add_widget = self.working_layout.addWidget
+        add_widget(self.slider)
+        add_widget(self.spinbox)
+        add_widget(self.adjust_button)
 
-        logger.debug(f"FloatParameterWidget created: {self.name} [{self.min_val}–{self.max_val}]")
+        logger.debug("FloatParameterWidget created: %s [%s–%s]", self.name, self.min_val, self.max_val)
     
     def _configure_spinbox(self):
         """Configure or reconfigure the spinbox with current settings.
@@ -111,7 +111,7 @@ class FloatParameter(Parameter):
         
         # Connect the signals
         self.slider.valueChanged.connect(self._on_slider_changed)
-        self.slider.sliderReleased.connect(lambda: self.valueChanged.emit(self.name, self.value))
+        self.slider.sliderReleased.connect(lambda: self._emit_value(self.value))
 
     def _block_all_signals(self, block=True):
         """Block or unblock signals from all controls to prevent unwanted updates.
@@ -138,8 +138,8 @@ class FloatParameter(Parameter):
         if abs(value - self.value) >= 1e-6:
             self.value = value
             self._sync_slider()
-            logger.debug(f"[{self.name}] SpinBox changed → {value}")
-            self.valueChanged.emit(self.name, value)
+            logger.debug("[%s] SpinBox changed → %s", self.name, value)
+            self._emit_value(value)
 
     def _on_slider_changed(self, slider_val: int):
         """Handle slider value change.
@@ -162,7 +162,7 @@ class FloatParameter(Parameter):
             self.spinbox.setValue(value)
             self._block_all_signals(False)
             
-            logger.debug(f"[{self.name}] Slider changed → {value}")
+            logger.debug("[%s] Slider changed → %s", self.name, value)
             # Signal is emitted on sliderReleased instead
 
     def _slider_position_to_value(self, position: int) -> float:
@@ -209,7 +209,7 @@ class FloatParameter(Parameter):
         if dialog.exec_():
             new_min, new_max, new_step = dialog.get_values()
             if new_min >= new_max or new_step <= 0:
-                logger.warning(f"[{self.name}] Invalid adjustment values")
+                logger.warning("[%s] Invalid adjustment values", self.name)
                 return
 
             # Store the current value to preserve after adjustment
@@ -217,11 +217,11 @@ class FloatParameter(Parameter):
             
             # Log changes
             if new_min != self.min_val:
-                logger.info(f"[{self.name}] Min changed: {self.min_val} → {new_min}")
+                logger.info("[%s] Min changed: %s → %s", self.name, self.min_val, new_min)
             if new_max != self.max_val:
-                logger.info(f"[{self.name}] Max changed: {self.max_val} → {new_max}")
+                logger.info("[%s] Max changed: %s → %s", self.name, self.max_val, new_max)
             if new_step != self.step:
-                logger.info(f"[{self.name}] Step changed: {self.step} → {new_step}")
+                logger.info("[%s] Step changed: %s → %s", self.name, self.step, new_step)
                 
             # Complete signal blockage - disconnect all signals
             self._block_all_signals(True)
@@ -245,7 +245,7 @@ class FloatParameter(Parameter):
             # Unblock signals after all updates are complete
             self._block_all_signals(False)
             
-            logger.debug(f"[{self.name}] Value set programmatically → {clamped_value}")
+            logger.debug("[%s] Value set programmatically → %s", self.name, clamped_value)
 
     def set_value(self, value: float) -> None:
         """Set the parameter value programmatically.
@@ -270,7 +270,7 @@ class FloatParameter(Parameter):
             # Unblock signals after all updates are complete
             self._block_all_signals(False)
             
-            logger.debug(f"[{self.name}] Value set programmatically → {clamped}")
+            logger.debug("[%s] Value set programmatically → %s", self.name, clamped)
 
     def get_value(self) -> float:
         """Get the current parameter value.
@@ -287,5 +287,5 @@ class FloatParameter(Parameter):
             callback: Function to call when value changes, with signature:
                      callback(parameter_name, parameter_value)
         """
-        self.valueChanged.connect(callback)
-        logger.debug(f"[{self.name}] Callback registered: {callback}")
+        super().register_callback(callback)
+        logger.debug("[%s] Callback registered: %s", self.name, callback)
@@ -4,13 +4,19 @@ This module provides the JoystickParameter class, which implements a 2D joystick
 control widget for tuning x,y coordinate parameters simultaneously.
 """
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout
-from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QPainterPath
-from PyQt5.QtCore import Qt, QPoint, QRect, QSize, pyqtSignal, QTimer
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QGraphicsItem
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QPolygonF, QPixmap, QImage, QRegion
+from PyQt5.QtCore import Qt, QPoint, QLine, QRect, QSize, pyqtSignal, QTimer, QEvent
+from PyQt5 import sip
 from typing import Callable, Dict, Optional, Tuple, Any, Union
-from math import sqrt, pow
+from dataclasses import dataclass
+from math import sqrt, ceil
+from time import monotonic
+import weakref
 
+import numpy as np
 
+from .._jit import njit, warm_up
 from .parameter import Parameter
 
 # Return mode constants for configuration
@@ -19,6 +25,153 @@ RETURN_MODE_HORIZONTAL = "horizontal"
 RETURN_MODE_VERTICAL = "vertical"
 RETURN_MODE_BOTH = "both"
 
+# Expo curve samples (input from -1.0 to 1.0), shared by every curve
+_EXPO_INPUT = np.linspace(-1.0, 1.0, 101)
+_EXPO_CUBIC_DELTA = _EXPO_INPUT * _EXPO_INPUT * _EXPO_INPUT - _EXPO_INPUT
+
+# Dead zone flags packed by _dead_zone_kernel
+_DZ_CIRCULAR = 1
+_DZ_X = 2
+_DZ_Y = 4
+
+
+@njit(cache=True)
+def _expo_kernel(x, y, expo_x, expo_y):
+    """Apply the expo curve to both axes.
+    
+    Args:
+        x: X position (-1.0 to 1.0)
+        y: Y position (-1.0 to 1.0)
+        expo_x: X-axis expo blend (0.0 = linear, 1.0 = cubic)
+        expo_y: Y-axis expo blend (0.0 = linear, 1.0 = cubic)
+        
+    Returns:
+        Position with exponential response applied (x, y)
+    """
+    # Standard expo formula, a linear blend with cubic: x*(1-f) + x^3*f.
+    # x^3 keeps the sign of x, so this folds to x + f*(x^3 - x) with no
+    # abs/sign handling and no branches (a zero blend leaves x unchanged)
+    return x + expo_x * (x * x * x - x), y + expo_y * (y * y * y - y)
+
+
+@njit(cache=True)
+def _dead_zone_kernel(x, y, distance_sq, dead_zone_sq, dead_zone_x, dead_zone_y):
+    """Classify a position against the dead zones and zero the affected axes.
+    
+    Args:
+        x: Raw X position (-1.0 to 1.0)
+        y: Raw Y position (-1.0 to 1.0)
+        distance_sq: x*x + y*y
+        dead_zone_sq: Squared radial dead zone
+        dead_zone_x: X-axis dead zone
+        dead_zone_y: Y-axis dead zone
+        
+    Returns:
+        Position with dead zone applied and the _DZ_* flags that matched (x, y, flags)
+    """
+    flags = 0
+    if distance_sq < dead_zone_sq:
+        flags |= _DZ_CIRCULAR
+    if abs(x) < dead_zone_x:
+        flags |= _DZ_X
+        x = 0.0
+    if abs(y) < dead_zone_y:
+        flags |= _DZ_Y
+        y = 0.0
+    if flags & _DZ_CIRCULAR:
+        return 0.0, 0.0, flags
+    return x, y, flags
+
+
+# Keys that move the stick from the keyboard
+_JOYSTICK_KEYS = frozenset((Qt.Key_Left, Qt.Key_Right, Qt.Key_Up, Qt.Key_Down, Qt.Key_Space))
+
+# Most pre-rendered labels kept per widget before the cache is cleared
+_LABEL_CACHE_LIMIT = 32
+
+# Smallest per-axis change that is worth re-emitting positionChanged for
+_EMIT_EPSILON = 1e-4
+
+# Paint resources shared by every joystick, built once instead of per frame
+_PEN_BORDER = QPen(QColor(100, 100, 100), 2)
+_BRUSH_BACKGROUND = QBrush(QColor(50, 50, 50))
+_PEN_DEAD_ZONE = QPen(QColor(255, 0, 0, 100), 1)          # Slightly more opaque red for the border
+_BRUSH_DEAD_ZONE = QBrush(QColor(255, 0, 0, 40))          # Red with 40/255 alpha (translucent)
+_PEN_X_DEAD_ZONE = QPen(QColor(255, 255, 0, 80), 1)       # More opaque yellow for border
+_BRUSH_X_DEAD_ZONE = QBrush(QColor(255, 255, 0, 30))      # Yellow with 30/255 alpha
+_PEN_Y_DEAD_ZONE = QPen(QColor(0, 255, 0, 80), 1)         # More opaque green for border
+_BRUSH_Y_DEAD_ZONE = QBrush(QColor(0, 255, 0, 30))        # Green with 30/255 alpha
+_PEN_AXES = QPen(QColor(180, 180, 180), 1)
+_PEN_CROSSHAIR = QPen(QColor(150, 150, 150), 1)
+_PEN_HANDLE = QPen(QColor(200, 200, 200), 2)
+_PEN_CONNECTION = QPen(QColor(150, 150, 150), 1, Qt.DashLine)
+_COLOR_TEXT = QColor(255, 255, 255)
+_PEN_TEXT = QPen(_COLOR_TEXT)
+_COLOR_X_CURVE = QColor(255, 80, 80, 180)  # Red with some transparency
+_COLOR_Y_CURVE = QColor(80, 80, 255, 180)  # Blue with some transparency
+_PEN_X_CURVE = QPen(_COLOR_X_CURVE, 2, Qt.SolidLine)
+_PEN_Y_CURVE = QPen(_COLOR_Y_CURVE, 2, Qt.SolidLine)
+_PEN_REFERENCE = QPen(QColor(150, 150, 150, 80), 1, Qt.DotLine)
+
+# Handle fill indexed by dead-zone state (see JoystickWidget._handle_state)
+_HANDLE_STATE_NONE = 0
+_HANDLE_STATE_DEAD = 1
+_HANDLE_STATE_X_DEAD = 2
+_HANDLE_STATE_Y_DEAD = 3
+_HANDLE_BRUSHES = (
+    QBrush(QColor(100, 150, 255)),  # Bluish when outside all dead zones
+    QBrush(QColor(200, 100, 100)),  # Reddish when in dead zone
+    QBrush(QColor(200, 200, 100)),  # Yellowish when in X dead zone
+    QBrush(QColor(100, 200, 100)),  # Greenish when in Y dead zone
+)
+
+
+@dataclass
+class _JoystickGeometry:
+    """Size-derived values used by painting and mouse handling.
+    
+    Rebuilt on resize and dead zone changes so the per-frame paths only read fields.
+    
+    Attributes:
+        center_x (int): X center of the widget
+        center_y (int): Y center of the widget
+        radius (int): Radius of the joystick area
+        curve_radius (int): Radius the expo curves are scaled to
+        handle_range (int): Distance the handle center can travel from the center
+        handle_range_sq (int): handle_range squared
+        inv_handle_range (float): 1 / handle_range, or 0.0 when there is no travel
+        inv_handle_range_sq (float): 1 / handle_range_sq, or 0.0 when there is no travel
+        outer_rect (QRect): Bounds of the outer circle
+        clip_region (QRegion): Circle the expo curves are clipped to
+        dead_zone_rect (QRect): Bounds of the circular dead zone
+        x_dead_zone_rect (QRect): X-axis dead zone band
+        y_dead_zone_rect (QRect): Y-axis dead zone band
+        x_axis_line (QLine): Horizontal axis
+        y_axis_line (QLine): Vertical axis
+        crosshair_lines (Tuple[QLine, QLine]): Center marker
+    """
+    __slots__ = ('center_x', 'center_y', 'radius', 'curve_radius', 'handle_range',
+                 'handle_range_sq', 'inv_handle_range', 'inv_handle_range_sq',
+                 'outer_rect', 'clip_region', 'dead_zone_rect', 'x_dead_zone_rect',
+                 'y_dead_zone_rect', 'x_axis_line', 'y_axis_line', 'crosshair_lines')
+
+    center_x: int
+    center_y: int
+    radius: int
+    curve_radius: int
+    handle_range: int
+    handle_range_sq: int
+    inv_handle_range: float
+    inv_handle_range_sq: float
+    outer_rect: QRect
+    clip_region: QRegion
+    dead_zone_rect: QRect
+    x_dead_zone_rect: QRect
+    y_dead_zone_rect: QRect
+    x_axis_line: QLine
+    y_axis_line: QLine
+    crosshair_lines: Tuple[QLine, QLine]
+
 
 class JoystickWidget(QWidget):
     """Custom widget that implements the joystick control UI.
@@ -37,13 +190,20 @@ class JoystickWidget(QWidget):
         _dead_zone_y: Y-axis specific dead zone value
         _exponential_x: X-axis exponential response factor (1.0 = linear)
         _exponential_y: Y-axis exponential response factor (1.0 = linear)
-        _update_timer: Timer for periodic position updates when pressed
+        _tick_timer: Timer shared by every widget for periodic position updates when pressed
+        _active_widgets: Widgets currently driven by the shared timer
         _update_frequency: Update frequency in Hz
+        _next_update: monotonic() time at which the shared timer next updates this widget
         _is_in_dead_zone: Whether the current position is inside the dead zone
+        _dirty: Whether a drag moved the handle since the last repaint
     """
     
     positionChanged = pyqtSignal(float, float)
     
+    # One timer serves every pressed joystick instead of one timer per widget
+    _tick_timer = None
+    _active_widgets = weakref.WeakSet()
+    
     def __init__(self, parent=None):
         """Initialize the joystick widget."""
         super().__init__(parent)
@@ -51,44 +211,226 @@ class JoystickWidget(QWidget):
         # Set minimum size
         self.setMinimumSize(100, 100)
         
+        # The background pixmap covers every pixel, so Qt needn't erase first
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        
         # Initialize position (x, y in range -1.0 to 1.0)
         self._position = (0.0, 0.0)
         self._raw_position = (0.0, 0.0)  # Position before dead zone is applied
         self._handle_radius = 10
         self._pressed = False
+        self._pressed_via_key = False  # Whether a stick key is being held
+        self._keys_down = set()        # Stick keys currently held
         
         # Return to center behavior
         self._return_mode = RETURN_MODE_BOTH
         
         # Dead zone settings
         self._dead_zone = 0.0      # Radial dead zone (circular)
+        self._dead_zone_sq = 0.0   # Squared radial dead zone, for distance-free tests
         self._dead_zone_x = 0.0    # X-axis specific dead zone
         self._dead_zone_y = 0.0    # Y-axis specific dead zone
+        self._has_circular_dead_zone = False  # Whether the radial dead zone is non-zero
+        self._has_dead_zone_x = False         # Whether the X-axis dead zone is non-zero
+        self._has_dead_zone_y = False         # Whether the Y-axis dead zone is non-zero
+        self._has_dead_zone = False           # Whether any of the above is non-zero
         
         # Exponential response settings
         self._exponential_x = 1.0  # X-axis exponential factor (internal, 1.0 = linear)
         self._exponential_y = 1.0  # Y-axis exponential factor (internal, 1.0 = linear)
         self._exponential_x_percent = 0.0  # X-axis exponential percentage (0-100%)
         self._exponential_y_percent = 0.0  # Y-axis exponential percentage (0-100%)
+        self._has_expo_x = False    # Whether the X axis has a non-zero expo
+        self._has_expo_y = False    # Whether the Y axis has a non-zero expo
+        self._expo_enabled = False  # Whether either axis has a non-zero expo
+        self._expo_factor_x = 0.0   # X-axis expo blend (percentage / 100)
+        self._expo_factor_y = 0.0   # Y-axis expo blend (percentage / 100)
+        
+        # Cached expo curve polylines, rebuilt when expo settings or geometry change
+        self._expo_x_polyline = None
+        self._expo_y_polyline = None
+        self._expo_reference_line = None
+        self._expo_cache_key = None
         
         # Track whether we're in any dead zone
         self._is_in_dead_zone = False
+        self._is_in_circular_dead_zone = False
         self._is_in_x_dead_zone = False
         self._is_in_y_dead_zone = False
         
-        # Update timer for continuous updates when pressed
-        self._update_timer = QTimer(self)
-        self._update_timer.timeout.connect(self._emit_position)
+        # Continuous updates when pressed come from the shared tick timer
         self._update_frequency = 10  # Default: 10 Hz
         self._update_interval = 1000 // self._update_frequency  # Convert to ms
+        self._next_update = 0.0
+        self._timer_was_active = False  # Updates paused by hideEvent, resumed by showEvent
+        self._always_emit = False       # Keep emitting while hidden
+        
+        # Drag repaints are deferred to the update timer
+        self._dirty = False
+        
+        # Pre-rendered static background, rebuilt on resize and config changes
+        self._bg_pixmap = None
+        
+        # Pre-rendered label pixmaps keyed by (text, rgba)
+        self._label_cache = {}
+        
+        # Pre-rendered handle pixmaps indexed by handle state, and the pixel ratio they were drawn at
+        self._handle_pixmaps = None
+        self._handle_pixmap_ratio = None
+        
+        # Font metrics for text placement, refreshed when the font changes
+        self._metrics = self.fontMetrics()
+        
+        # Coordinate text and its width for the last painted position
+        self._coord_key = None
+        self._coord_text = ""
+        self._coord_width = 0
+        
+        # Last position sent through positionChanged, to drop duplicate emits
+        self._last_emitted = (None, None)
+        
+        # Size-dependent geometry, recomputed on resize instead of every paint
+        self._recompute_geometry()
+        
+        warm_up(_expo_kernel, 0.0, 0.0, 0.0, 0.0)
+        warm_up(_dead_zone_kernel, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
         
         # Set focus policy to accept keyboard focus
         self.setFocusPolicy(Qt.StrongFocus)
     
+    @classmethod
+    def _on_tick(cls):
+        """Run the periodic update of every active widget that is due for one.
+        
+        The timer runs at the fastest rate any widget asks for, so slower
+        widgets skip the ticks that come before their own next update.
+        """
+        now = monotonic()
+        # A tick landing up to half an interval early still counts, so timer
+        # jitter doesn't push a widget's update back by a whole tick
+        early = cls._tick_timer.interval() / 2000
+        for widget in list(cls._active_widgets):
+            if sip.isdeleted(widget):
+                cls._active_widgets.discard(widget)
+            elif now + early >= widget._next_update:
+                interval = widget._update_interval / 1000
+                next_update = widget._next_update + interval
+                # After a stall, restart the schedule instead of catching up
+                widget._next_update = next_update if next_update > now else now + interval
+                widget._emit_position()
+        if not cls._active_widgets:
+            cls._tick_timer.stop()
+    
+    @classmethod
+    def _restart_tick(cls):
+        """Start, retime or stop the shared timer to match the active widgets."""
+        timer = cls._tick_timer
+        # The timer belongs to the application and is deleted along with it
+        if timer is not None and sip.isdeleted(timer):
+            timer = cls._tick_timer = None
+        if not cls._active_widgets:
+            if timer is not None:
+                timer.stop()
+            return
+        if timer is None:
+            cls._tick_timer = QTimer(QApplication.instance())
+            cls._tick_timer.setTimerType(Qt.PreciseTimer)
+            cls._tick_timer.timeout.connect(cls._on_tick)
+        # Run at the fastest rate any active widget asks for
+        interval = min(widget._update_interval for widget in cls._active_widgets)
+        if not cls._tick_timer.isActive() or cls._tick_timer.interval() != interval:
+            cls._tick_timer.start(interval)
+    
+    def _start_updates(self):
+        """Register with the shared timer for continuous updates."""
+        self._next_update = monotonic() + self._update_interval / 1000
+        JoystickWidget._active_widgets.add(self)
+        JoystickWidget._restart_tick()
+    
+    def _stop_updates(self):
+        """Unregister from the shared timer."""
+        JoystickWidget._active_widgets.discard(self)
+        JoystickWidget._restart_tick()
+    
+    def _updates_active(self) -> bool:
+        """Check whether the shared timer is currently driving this widget.
+        
+        Returns:
+            True if continuous updates are running for this widget
+        """
+        return self in JoystickWidget._active_widgets
+    
     def _emit_position(self):
-        """Emit the current position through the signal."""
-        if self._pressed and not self._is_in_dead_zone:
-            self.positionChanged.emit(*self._position)
+        """Flush any pending repaint and emit the current position through the signal."""
+        self._flush_update()
+        if not (self._always_emit or self._is_exposed()):
+            return
+        # Keyboard moves bypass the dead zones, so only mouse drags are gated on them
+        if self._pressed_via_key or (self._pressed and not self._is_in_dead_zone):
+            self._emit_if_changed(*self._position)
+    
+    def _is_exposed(self) -> bool:
+        """Check whether any part of the widget can currently be seen.
+        
+        Covers being scrolled out of view or fully covered by siblings,
+        which do not produce hide events.
+        
+        Returns:
+            True if the widget is visible and its visible region is not empty
+        """
+        return self.isVisible() and not self.visibleRegion().isEmpty()
+    
+    def _emit_if_changed(self, x: float, y: float):
+        """Emit positionChanged unless the position matches the last one emitted.
+        
+        Args:
+            x: X position (-1.0 to 1.0)
+            y: Y position (-1.0 to 1.0)
+        """
+        last_x, last_y = self._last_emitted
+        if last_x is None or abs(x - last_x) > _EMIT_EPSILON or abs(y - last_y) > _EMIT_EPSILON:
+            self._last_emitted = (x, y)
+            self.positionChanged.emit(x, y)
+    
+    def _flush_update(self):
+        """Schedule a repaint if a drag has moved the handle since the last one."""
+        if self._dirty:
+            self._dirty = False
+            self._update_handle()
+    
+    def _handle_rect(self, x: float, y: float) -> QRect:
+        """Get the area covered by the handle, its connection line and its text.
+        
+        Args:
+            x: X position (-1.0 to 1.0)
+            y: Y position (-1.0 to 1.0)
+            
+        Returns:
+            Rect in widget coordinates
+        """
+        g = self._geom
+        center_x = g.center_x
+        center_y = g.center_y
+        handle_x = center_x + int(x * g.handle_range)
+        handle_y = center_y - int(y * g.handle_range)
+        
+        # Handle and the line back to the center, with room for pens and antialiasing
+        r = self._handle_radius + 2
+        rect = QRect(QPoint(min(center_x, handle_x - r), min(center_y, handle_y - r)),
+                     QPoint(max(center_x, handle_x + r), max(center_y, handle_y + r)))
+        
+        # Text to the right of the handle; it is clipped at the widget edge anyway
+        metrics = self._metrics
+        text_rect = QRect(handle_x + 14, handle_y - metrics.ascent() - 1,
+                          self.width(), metrics.height() + 2)
+        return rect.united(text_rect)
+    
+    def _update_handle(self):
+        """Schedule a repaint of the previous and current handle areas only."""
+        rect = self._handle_rect(*self._position)
+        self.update(rect.united(self._last_handle_rect))
+        self._last_handle_rect = rect
     
     def set_update_frequency(self, frequency_hz: float):
         """Set the update frequency for continuous updates when pressed.
@@ -101,11 +443,18 @@ class JoystickWidget(QWidget):
             # Convert to millisecond interval (rounded to nearest ms)
             self._update_interval = round(1000 / frequency_hz)
             
-            # Restart timer if it's running
-            if self._update_timer.isActive():
-                self._update_timer.stop()
-                self._update_timer.start(self._update_interval)
+            # Retime the shared timer if it's driving this widget
+            if self._updates_active():
+                JoystickWidget._restart_tick()
                 
+    def set_always_emit(self, always_emit: bool):
+        """Set whether continuous updates are emitted while the widget is hidden.
+        
+        Args:
+            always_emit: True to keep emitting when hidden, False to pause
+        """
+        self._always_emit = bool(always_emit)
+    
     def get_update_frequency(self) -> float:
         """Get the current update frequency.
         
@@ -125,6 +474,10 @@ class JoystickWidget(QWidget):
         """
         # Clamp to valid range (0.0 to 0.9)
         self._dead_zone = max(0.0, min(0.9, dead_zone))
+        self._dead_zone_sq = self._dead_zone * self._dead_zone
+        self._update_dead_zone_flags()
+        self._recompute_geometry()
+        self._bg_pixmap = None
         
         # Check if current position is in the dead zone
         self._check_dead_zone(*self._raw_position)
@@ -138,35 +491,33 @@ class JoystickWidget(QWidget):
         """
         self._dead_zone_x = max(0.0, min(0.9, x_dead_zone))
         self._dead_zone_y = max(0.0, min(0.9, y_dead_zone))
+        self._update_dead_zone_flags()
+        self._recompute_geometry()
+        self._bg_pixmap = None
         
         # Check if current position is in any dead zone
         self._check_dead_zone(*self._raw_position)
 
-    def _check_dead_zone(self, x: float, y: float) -> bool:
+    def _update_dead_zone_flags(self):
+        """Refresh the cached flags telling which dead zones are enabled."""
+        self._has_circular_dead_zone = self._dead_zone > 0.0
+        self._has_dead_zone_x = self._dead_zone_x > 0.0
+        self._has_dead_zone_y = self._dead_zone_y > 0.0
+        self._has_dead_zone = (self._has_circular_dead_zone or self._has_dead_zone_x
+                               or self._has_dead_zone_y)
+
+    def _check_dead_zone(self, x: float, y: float, distance_sq: Optional[float] = None) -> bool:
         """Check if the given position is within any dead zone.
         
         Args:
             x: X position (-1.0 to 1.0)
             y: Y position (-1.0 to 1.0)
+            distance_sq: Precomputed x*x + y*y, if the caller already has it
             
         Returns:
             True if position is in any dead zone, False otherwise
         """
-        # Store raw position
-        self._raw_position = (x, y)
-        
-        # Check circular dead zone
-        distance = sqrt(x*x + y*y)
-        in_circular_dead_zone = distance < self._dead_zone
-        
-        # Check axis-specific dead zones
-        self._is_in_x_dead_zone = abs(x) < self._dead_zone_x
-        self._is_in_y_dead_zone = abs(y) < self._dead_zone_y
-        
-        # The position is in a dead zone if it's in the circular dead zone
-        # or if it's in both axis-specific dead zones
-        self._is_in_dead_zone = in_circular_dead_zone or (self._is_in_x_dead_zone and self._is_in_y_dead_zone)
-        
+        self._apply_dead_zone(x, y, distance_sq)
         return self._is_in_dead_zone
 
     def set_exponential(self, x_expo_percent: float, y_expo_percent: float):
@@ -187,6 +538,10 @@ class JoystickWidget(QWidget):
         x_expo_percent = max(0.0, min(100.0, x_expo_percent))
         y_expo_percent = max(0.0, min(100.0, y_expo_percent))
         
+        # UI callbacks often re-send the current values
+        if x_expo_percent == self._exponential_x_percent and y_expo_percent == self._exponential_y_percent:
+            return
+        
         # Convert percentage to internal exponential factor (1.0 = linear, 5.0 = max exponential)
         # Using a maximum factor of 5.0 which provides a good range of control
         MAX_EXPO_FACTOR = 5.0
@@ -199,11 +554,29 @@ class JoystickWidget(QWidget):
         self._exponential_x_percent = x_expo_percent
         self._exponential_y_percent = y_expo_percent
         
-        # Update the current position with the new exponential factors
-        if self._raw_position != (0.0, 0.0):
-            x, y = self._apply_dead_zone(*self._raw_position)
+        # Normalized blend factors (0-1) used by the per-move math
+        self._has_expo_x = x_expo_percent > 0.0
+        self._has_expo_y = y_expo_percent > 0.0
+        self._expo_enabled = self._has_expo_x or self._has_expo_y
+        self._expo_factor_x = x_expo_percent / 100.0
+        self._expo_factor_y = y_expo_percent / 100.0
+        
+        # Curves must be rebuilt for the new factors
+        self._expo_cache_key = None
+        self._bg_pixmap = None
+        
+        # Update the current position with the new exponential factors; the dead
+        # zone flags can't change here, so the kernel is called without updating them
+        x, y = self._raw_position
+        if (x, y) != (0.0, 0.0):
+            if self._has_dead_zone:
+                x, y, _ = _dead_zone_kernel(
+                    x, y, x*x + y*y, self._dead_zone_sq, self._dead_zone_x, self._dead_zone_y
+                )
             self._position = self._apply_exponential(x, y)
-            self.update()
+        
+        # Repaint once for the new curves and position
+        self.update()
 
     def _apply_exponential(self, x: float, y: float) -> Tuple[float, float]:
         """Apply exponential response to a position.
@@ -216,73 +589,51 @@ class JoystickWidget(QWidget):
             Position with exponential response applied (x, y)
         """
         # If exponential factors are 1.0 (0% expo), no change needed
-        if self._exponential_x_percent == 0.0 and self._exponential_y_percent == 0.0:
+        if not self._expo_enabled:
             return (x, y)
-            
-        # Apply exponential response to each axis while preserving sign
-        result_x = x
-        result_y = y
-        
-        # Use the standard expo formula: output = input * (1 - expo) + (input^3) * expo
-        # This creates a smooth blend between linear and cubic response
-        
-        if self._exponential_x_percent > 0.0 and x != 0.0:
-            # Convert percentage (0-100%) to normalized expo factor (0-1)
-            expo_factor = self._exponential_x_percent / 100.0
-            # Apply the formula while preserving sign
-            sign_x = 1.0 if x > 0.0 else -1.0
-            abs_x = abs(x)
-            # Standard expo formula: linear blend with cubic
-            result_x = sign_x * (abs_x * (1.0 - expo_factor) + (abs_x ** 3) * expo_factor)
-            
-        if self._exponential_y_percent > 0.0 and y != 0.0:
-            # Convert percentage (0-100%) to normalized expo factor (0-1)
-            expo_factor = self._exponential_y_percent / 100.0
-            # Apply the formula while preserving sign
-            sign_y = 1.0 if y > 0.0 else -1.0
-            abs_y = abs(y)
-            # Standard expo formula: linear blend with cubic
-            result_y = sign_y * (abs_y * (1.0 - expo_factor) + (abs_y ** 3) * expo_factor)
-            
-        return (result_x, result_y)
+        
+        return _expo_kernel(x, y, self._expo_factor_x, self._expo_factor_y)
 
-    def _apply_dead_zone(self, x: float, y: float) -> Tuple[float, float]:
+    def _apply_dead_zone(self, x: float, y: float, distance_sq: Optional[float] = None) -> Tuple[float, float]:
         """Apply dead zones to raw position values.
         
         This method implements axis-specific dead zones in addition to the circular dead zone.
         For axis dead zones, when one axis is in its dead zone but the other isn't,
-        the axis in the dead zone is zeroed out.
+        the axis in the dead zone is zeroed out. The dead zone flags are updated as a side effect.
         
         Args:
             x: Raw X position (-1.0 to 1.0)
             y: Raw Y position (-1.0 to 1.0)
+            distance_sq: Precomputed x*x + y*y, if the caller already has it
             
         Returns:
             Position with dead zone applied (x, y)
         """
-        # Check all dead zones first
-        self._check_dead_zone(x, y)
+        # Store raw position
+        self._raw_position = (x, y)
         
-        # Calculate distance from center for circular dead zone
-        distance = sqrt(x*x + y*y)
+        # No dead zones configured: nothing to test or zero out
+        if not self._has_dead_zone:
+            self._is_in_dead_zone = self._is_in_circular_dead_zone = False
+            self._is_in_x_dead_zone = self._is_in_y_dead_zone = False
+            return (x, y)
+        
+        # Squared distances avoid a sqrt
+        if distance_sq is None:
+            distance_sq = x*x + y*y
+        result_x, result_y, flags = _dead_zone_kernel(
+            x, y, distance_sq, self._dead_zone_sq, self._dead_zone_x, self._dead_zone_y
+        )
+        
+        in_circular_dead_zone = bool(flags & _DZ_CIRCULAR)
+        self._is_in_circular_dead_zone = in_circular_dead_zone
+        self._is_in_x_dead_zone = in_x_dead_zone = bool(flags & _DZ_X)
+        self._is_in_y_dead_zone = in_y_dead_zone = bool(flags & _DZ_Y)
+        
+        # The position is in a dead zone if it's in the circular dead zone
+        # or if it's in both axis-specific dead zones
+        self._is_in_dead_zone = in_circular_dead_zone or (in_x_dead_zone and in_y_dead_zone)
         
-        # Apply circular dead zone - if within circular dead zone, return (0,0)
-        if distance < self._dead_zone:
-            return (0.0, 0.0)
-            
-        # Apply axis-specific dead zones - if one axis is in dead zone but other isn't,
-        # zero out the axis in the dead zone
-        result_x = x
-        result_y = y
-        
-        # If we're in X axis dead zone but not in circular dead zone, zero out X
-        if self._is_in_x_dead_zone and not distance < self._dead_zone:
-            result_x = 0.0
-            
-        # If we're in Y axis dead zone but not in circular dead zone, zero out Y    
-        if self._is_in_y_dead_zone and not distance < self._dead_zone:
-            result_y = 0.0
-            
         return (result_x, result_y)
     
     def sizeHint(self) -> QSize:
@@ -292,270 +643,118 @@ class JoystickWidget(QWidget):
             The suggested size
         """
         return QSize(150, 150)
-        
-    def paintEvent(self, event):
-        """Draw the joystick widget.
+    
+    def resizeEvent(self, event):
+        """Invalidate size-dependent caches when the widget is resized.
         
         Args:
-            event: Paint event
+            event: Resize event
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Calculate the dimensions
+        self._expo_cache_key = None
+        self._bg_pixmap = None
+        self._recompute_geometry()
+        super().resizeEvent(event)
+    
+    def _recompute_geometry(self):
+        """Recompute the geometry that depends on the widget size and dead zones."""
         width = self.width()
         height = self.height()
         size = min(width, height)
-        
         center_x = width // 2
         center_y = height // 2
         radius = size // 2
         
-        # Draw the outer border (circle)
-        painter.setPen(QPen(QColor(100, 100, 100), 2))
-        painter.setBrush(QBrush(QColor(50, 50, 50)))
-        
-        outer_rect = QRect((width - size) // 2, (height - size) // 2, size, size)
-        painter.drawEllipse(outer_rect)
-        
-        # Draw exponential response visualization if enabled
-        if self._exponential_x > 1.0 or self._exponential_y > 1.0:
-            self._draw_exponential_visualization(painter, center_x, center_y, radius)
-        
-        # Draw the circular dead zone if it's set
-        if self._dead_zone > 0.0:
-            # Calculate the dead zone radius
-            dead_zone_radius = int(radius * self._dead_zone)
-            
-            # Create a semi-transparent red for the dead zone
-            dead_zone_color = QColor(255, 0, 0, 40)  # Red with 40/255 alpha (translucent)
-            painter.setPen(QPen(QColor(255, 0, 0, 100), 1))  # Slightly more opaque red for the border
-            painter.setBrush(QBrush(dead_zone_color))
-            
-            # Draw the dead zone circle
-            dead_zone_rect = QRect(
-                center_x - dead_zone_radius, 
+        # Handle travel, with reciprocals so mouse moves multiply instead of divide
+        handle_range = radius - self._handle_radius
+        handle_range_sq = handle_range * handle_range
+        if handle_range > 0:
+            inv_handle_range = 1.0 / handle_range
+            inv_handle_range_sq = 1.0 / handle_range_sq
+        else:
+            inv_handle_range = inv_handle_range_sq = 0.0
+        
+        # Clip for the expo curves, limiting drawing to inside the circle
+        # A region clip is cheaper to set and to test against than a path clip
+        clip_region = QRegion(center_x - radius, center_y - radius, radius * 2, radius * 2,
+                              QRegion.Ellipse)
+        
+        # Dead zones, scaled from the joystick radius
+        dead_zone_radius = int(radius * self._dead_zone)
+        x_dead_zone_width = int(radius * self._dead_zone_x)
+        y_dead_zone_height = int(radius * self._dead_zone_y)
+        
+        self._geom = _JoystickGeometry(
+            center_x=center_x,
+            center_y=center_y,
+            radius=radius,
+            # Use smaller radius for curves to ensure they stay within the circle
+            curve_radius=int(radius * 0.85),
+            handle_range=handle_range,
+            handle_range_sq=handle_range_sq,
+            inv_handle_range=inv_handle_range,
+            inv_handle_range_sq=inv_handle_range_sq,
+            outer_rect=QRect((width - size) // 2, (height - size) // 2, size, size),
+            clip_region=clip_region,
+            dead_zone_rect=QRect(
+                center_x - dead_zone_radius,
                 center_y - dead_zone_radius,
                 dead_zone_radius * 2,
                 dead_zone_radius * 2
-            )
-            painter.drawEllipse(dead_zone_rect)
-            
-        # Draw X-axis dead zone if set
-        if self._dead_zone_x > 0.0:
-            # Calculate the dead zone width
-            x_dead_zone_width = int(radius * self._dead_zone_x)
-            
-            # Create a semi-transparent yellow for the X dead zone
-            x_dead_zone_color = QColor(255, 255, 0, 30)  # Yellow with 30/255 alpha
-            painter.setPen(QPen(QColor(255, 255, 0, 80), 1))  # More opaque yellow for border
-            painter.setBrush(QBrush(x_dead_zone_color))
-            
-            # Draw the X-axis dead zone rectangle
-            x_dead_zone_rect = QRect(
+            ),
+            x_dead_zone_rect=QRect(
                 center_x - x_dead_zone_width,
                 center_y - radius + 5,
                 x_dead_zone_width * 2,
                 2 * radius - 10
-            )
-            painter.drawRect(x_dead_zone_rect)
-            
-        # Draw Y-axis dead zone if set
-        if self._dead_zone_y > 0.0:
-            # Calculate the dead zone height
-            y_dead_zone_height = int(radius * self._dead_zone_y)
-            
-            # Create a semi-transparent green for the Y dead zone
-            y_dead_zone_color = QColor(0, 255, 0, 30)  # Green with 30/255 alpha
-            painter.setPen(QPen(QColor(0, 255, 0, 80), 1))  # More opaque green for border
-            painter.setBrush(QBrush(y_dead_zone_color))
-            
-            # Draw the Y-axis dead zone rectangle
-            y_dead_zone_rect = QRect(
+            ),
+            y_dead_zone_rect=QRect(
                 center_x - radius + 5,
                 center_y - y_dead_zone_height,
                 2 * radius - 10,
                 y_dead_zone_height * 2
-            )
-            painter.drawRect(y_dead_zone_rect)
-
-        # Draw X and Y axes
-        painter.setPen(QPen(QColor(180, 180, 180), 1))
-        # X-axis (horizontal line)
-        painter.drawLine(center_x - radius + 5, center_y, center_x + radius - 5, center_y)
-        # Y-axis (vertical line)
-        painter.drawLine(center_x, center_y - radius + 5, center_x, center_y + radius - 5)
-        
-        # Draw the center position marker
-        painter.setPen(QPen(QColor(150, 150, 150), 1))
-        
-        # Draw crosshair at center
-        painter.drawLine(center_x - 5, center_y, center_x + 5, center_y)
-        painter.drawLine(center_x, center_y - 5, center_x, center_y + 5)
-        
-        # Calculate the handle position
-        x, y = self._position
-        handle_x = center_x + int(x * (size // 2 - self._handle_radius))
-        handle_y = center_y - int(y * (size // 2 - self._handle_radius))  # Invert Y for screen coords
-        
-        # Set handle color based on whether it's in a dead zone
-        if self._is_in_dead_zone:
-            handle_color = QColor(200, 100, 100)  # Reddish when in dead zone
-        elif self._is_in_x_dead_zone:
-            handle_color = QColor(200, 200, 100)  # Yellowish when in X dead zone
-        elif self._is_in_y_dead_zone:
-            handle_color = QColor(100, 200, 100)  # Greenish when in Y dead zone
-        else:
-            handle_color = QColor(100, 150, 255)  # Bluish when outside all dead zones
-        
-        # Draw the handle
-        painter.setPen(QPen(QColor(200, 200, 200), 2))
-        painter.setBrush(QBrush(handle_color))
-        painter.drawEllipse(QPoint(handle_x, handle_y), self._handle_radius, self._handle_radius)
-        
-        # Draw connection line from center to handle
-        painter.setPen(QPen(QColor(150, 150, 150), 1, Qt.DashLine))
-        painter.drawLine(center_x, center_y, handle_x, handle_y)
-        
-        # Display current coordinates near the handle
-        painter.setPen(QColor(255, 255, 255))
-        coord_text = f"({x:.2f}, {y:.2f})"
-        
-        # Add indicator for current state
-        if self._is_in_dead_zone:
-            coord_text += " [DEAD ZONE]"
-        elif self._is_in_x_dead_zone:
-            coord_text += " [X DEAD]"
-        elif self._is_in_y_dead_zone:
-            coord_text += " [Y DEAD]"
-        elif self._exponential_x > 1.0 or self._exponential_y > 1.0:
-            # Show percentage values instead of raw factors
-            x_percent = self._exponential_x_percent
-            y_percent = self._exponential_y_percent
-            coord_text += f" [EXP {x_percent:.0f}%,{y_percent:.0f}%]"
-            
-        painter.drawText(handle_x + 15, handle_y, coord_text)
-    
-    def _draw_exponential_visualization(self, painter, center_x, center_y, radius):
-        """Draw visualization of exponential response curve.
+            ),
+            x_axis_line=QLine(center_x - radius + 5, center_y, center_x + radius - 5, center_y),
+            y_axis_line=QLine(center_x, center_y - radius + 5, center_x, center_y + radius - 5),
+            crosshair_lines=(
+                QLine(center_x - 5, center_y, center_x + 5, center_y),
+                QLine(center_x, center_y - 5, center_x, center_y + 5),
+            ),
+        )
+        self._last_handle_rect = self._handle_rect(*self._position)
+        
+    def hideEvent(self, event):
+        """Pause continuous updates while the widget is hidden.
         
         Args:
-            painter: QPainter instance
-            center_x: X center of the joystick
-            center_y: Y center of the joystick
-            radius: Radius of the joystick area
+            event: Hide event
         """
-        # Save current painter state
-        painter.save()
-        
-        # Use smaller radius for curves to ensure they stay within the circle
-        curve_radius = int(radius * 0.85)
-        
-        # Use semi-transparent colors for better visibility
-        x_curve_color = QColor(255, 80, 80, 180)  # Red with some transparency
-        y_curve_color = QColor(80, 80, 255, 180)  # Blue with some transparency
+        # Key releases won't reach a hidden widget
+        self._keys_down.clear()
+        self._release_keys()
+        
+        if self._updates_active() and not self._always_emit:
+            self._stop_updates()
+            self._timer_was_active = True
+        super().hideEvent(event)
+    
+    def showEvent(self, event):
+        """Resume continuous updates if they were paused by hideEvent.
         
-        # Create a clipping path to limit drawing to inside the circle
-        clip_path = QPainterPath()
-        clip_path.addEllipse(center_x - radius, center_y - radius, radius * 2, radius * 2)
-        painter.setClipPath(clip_path)
+        Also enables device coordinate caching when shown through a QGraphicsProxyWidget.
         
-        # Draw X-axis exponential grid if enabled
-        if self._exponential_x_percent > 0.0:
-            # Set pen to a solid red line for the curve
-            painter.setPen(QPen(x_curve_color, 2, Qt.SolidLine))
-            
-            # Create a path for the exponential curve using the standard expo formula
-            path = QPainterPath()
-            
-            # Draw X-axis curve
-            points = []
-            expo_factor = self._exponential_x_percent / 100.0  # Convert to 0-1 range
-            
-            # Add many points to make the curve smooth
-            for i in range(101):
-                # Input from -1.0 to 1.0
-                input_x = -1.0 + (i * 0.02)
-                
-                # Calculate output using the standard expo formula
-                sign_x = 1.0 if input_x > 0.0 else -1.0
-                abs_x = abs(input_x)
-                # Standard expo formula: linear blend with cubic
-                output_x = sign_x * (abs_x * (1.0 - expo_factor) + (abs_x ** 3) * expo_factor)
-                
-                # Calculate pixel positions (using smaller curve_radius to avoid edge overlap)
-                px = center_x + int(input_x * curve_radius)  # X position based on input
-                py = center_y - int(output_x * curve_radius)  # Y position based on output (inverted)
-                
-                points.append((px, py))
-            
-            # Create the path
-            if points:
-                path.moveTo(points[0][0], points[0][1])
-                for px, py in points[1:]:
-                    path.lineTo(px, py)
-                    
-            painter.drawPath(path)
-            
-            # Draw small label to indicate X-axis expo (moved inside for better positioning)
-            painter.setPen(QPen(x_curve_color, 1))
-            # Position label closer to the center to ensure it stays inside the circle
-            label_x = center_x + int(curve_radius * 0.5)
-            label_y = center_y - int(curve_radius * 0.5)
-            painter.drawText(label_x, label_y, f"X:{self._exponential_x_percent:.0f}%")
-            
-        # Draw Y-axis exponential grid if enabled
-        if self._exponential_y_percent > 0.0:
-            # Set pen to a solid blue line for the curve (to distinguish from X)
-            painter.setPen(QPen(y_curve_color, 2, Qt.SolidLine))
-            
-            # Create a path for the exponential curve using the standard expo formula
-            path = QPainterPath()
-            
-            # Draw Y-axis curve
-            points = []
-            expo_factor = self._exponential_y_percent / 100.0  # Convert to 0-1 range
-            
-            # Add many points to make the curve smooth
-            for i in range(101):
-                # Input from -1.0 to 1.0
-                input_y = -1.0 + (i * 0.02)
-                
-                # Calculate output using the standard expo formula
-                sign_y = 1.0 if input_y > 0.0 else -1.0
-                abs_y = abs(input_y)
-                # Standard expo formula: linear blend with cubic
-                output_y = sign_y * (abs_y * (1.0 - expo_factor) + (abs_y ** 3) * expo_factor)
-                
-                # Calculate pixel positions (using smaller curve_radius to avoid edge overlap)
-                px = center_x + int(output_y * curve_radius)  # X position based on output
-                py = center_y - int(input_y * curve_radius)  # Y position based on input (inverted)
-                
-                points.append((px, py))
-            
-            # Create the path
-            if points:
-                path.moveTo(points[0][0], points[0][1])
-                for px, py in points[1:]:
-                    path.lineTo(px, py)
-                    
-            painter.drawPath(path)
-            
-            # Draw small label to indicate Y-axis expo (moved inside for better positioning)
-            painter.setPen(QPen(y_curve_color, 1))
-            # Position label closer to the center to ensure it stays inside the circle
-            label_x = center_x - int(curve_radius * 0.3)
-            label_y = center_y - int(curve_radius * 0.5)
-            painter.drawText(label_x, label_y, f"Y:{self._exponential_y_percent:.0f}%")
-            
-        # Draw 1:1 reference line (diagonal) with a dotted light gray line
-        if self._exponential_x_percent > 0.0 or self._exponential_y_percent > 0.0:
-            painter.setPen(QPen(QColor(150, 150, 150, 80), 1, Qt.DotLine))
-            painter.drawLine(center_x - curve_radius, center_y + curve_radius, 
-                            center_x + curve_radius, center_y - curve_radius)
-        
-        # Restore painter state (which also removes the clipping path)
-        painter.restore()
+        Args:
+            event: Show event
+        """
+        if self._timer_was_active:
+            self._timer_was_active = False
+            if self._pressed or self._pressed_via_key:
+                self._start_updates()
+        
+        # When embedded in a graphics scene, let the proxy reuse its raster
+        proxy = self.graphicsProxyWidget()
+        if proxy is not None:
+            proxy.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        super().showEvent(event)
     
     def mousePressEvent(self, event):
         """Handle mouse press events.
@@ -566,12 +765,13 @@ class JoystickWidget(QWidget):
         if event.button() == Qt.LeftButton:
             self._pressed = True
             self._update_position(event.x(), event.y(), emit_signal=False)
+            self._flush_update()
             self.setFocus()
             # Emit initial position immediately only if outside dead zone
             if not self._is_in_dead_zone:
-                self.positionChanged.emit(*self._position)
-            # Start the update timer with current frequency
-            self._update_timer.start(self._update_interval)
+                self._emit_if_changed(*self._position)
+            # Start continuous updates at the current frequency
+            self._start_updates()
     
     def mouseMoveEvent(self, event):
         """Handle mouse move events.
@@ -585,7 +785,7 @@ class JoystickWidget(QWidget):
             
             # If we've moved from inside to outside the dead zone, emit the position
             if prev_in_dead_zone and not self._is_in_dead_zone:
-                self.positionChanged.emit(*self._position)
+                self._emit_if_changed(*self._position)
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release events.
@@ -595,8 +795,9 @@ class JoystickWidget(QWidget):
         """
         if event.button() == Qt.LeftButton:
             self._pressed = False
-            # Stop the update timer
-            self._update_timer.stop()
+            # Stop continuous updates and show the final drag position
+            self._stop_updates()
+            self._flush_update()
             self._apply_return_to_center(emit_signal=True)
     
     def _apply_return_to_center(self, emit_signal=True):
@@ -619,9 +820,9 @@ class JoystickWidget(QWidget):
         # Update position if changed
         if (x, y) != self._position:
             self._position = (x, y)
-            self.update()
+            self._update_handle()
             if emit_signal:
-                self.positionChanged.emit(x, y)
+                self._emit_if_changed(x, y)
     
     def set_return_mode(self, mode: str):
         """Set the return-to-center mode.
@@ -635,6 +836,9 @@ class JoystickWidget(QWidget):
     def keyPressEvent(self, event):
         """Handle keyboard events for joystick control.
         
+        Held keys are coalesced like mouse drags: the position changes on every
+        key repeat, but repaints and emits wait for the update timer.
+        
         Args:
             event: Key event
         """
@@ -659,10 +863,53 @@ class JoystickWidget(QWidget):
         # Update position if it changed
         if (x, y) != self._position:
             self._position = (x, y)
-            self.update()
-            self.positionChanged.emit(x, y)
+            self._dirty = True
+        
+        self._keys_down.add(event.key())
+        if not self._pressed_via_key:
+            # First press: respond immediately, then let the timer take over
+            self._pressed_via_key = True
+            self._emit_position()
+            self._start_updates()
     
-    def _update_position(self, mouse_x, mouse_y, emit_signal=False):
+    def keyReleaseEvent(self, event):
+        """Stop keyboard-driven updates once no stick key is held.
+        
+        Args:
+            event: Key event
+        """
+        key = event.key()
+        if key not in _JOYSTICK_KEYS:
+            super().keyReleaseEvent(event)
+            return
+        if event.isAutoRepeat():
+            return
+        
+        self._keys_down.discard(key)
+        if not self._keys_down:
+            self._release_keys()
+    
+    def focusOutEvent(self, event):
+        """Release held stick keys, whose release events now go elsewhere.
+        
+        Args:
+            event: Focus event
+        """
+        self._keys_down.clear()
+        self._release_keys()
+        super().focusOutEvent(event)
+    
+    def _release_keys(self):
+        """End keyboard-driven updates once no stick key is held."""
+        if self._pressed_via_key:
+            # Deliver the final position before the timer stops, even if scrolled out of view
+            self._flush_update()
+            self._emit_if_changed(*self._position)
+            self._pressed_via_key = False
+            if not self._pressed:
+                self._stop_updates()
+    
+    def _update_position(self, mouse_x, mouse_y, emit_signal=False, _sqrt=sqrt):
         """Update joystick position based on mouse coordinates.
         
         Converts screen coordinates to normalized -1.0 to 1.0 range.
@@ -671,45 +918,44 @@ class JoystickWidget(QWidget):
             mouse_x: Mouse X position
             mouse_y: Mouse Y position
             emit_signal: Whether to emit positionChanged signal
+            _sqrt: Local binding of math.sqrt (not meant to be passed)
         """
-        # Calculate center and radius
-        width = self.width()
-        height = self.height()
-        center_x = width // 2
-        center_y = height // 2
-        max_distance = min(width, height) // 2 - self._handle_radius
-        
-        # Calculate the distance from center
-        dx = mouse_x - center_x
-        dy = center_y - mouse_y  # Invert Y for logical coordinates
-        
-        # Calculate the distance and angle
-        from math import sqrt
-        distance = sqrt(dx*dx + dy*dy)
-        
-        # Normalize the position to -1.0 to 1.0 range
-        if distance > max_distance:
-            dx = dx * max_distance / distance
-            dy = dy * max_distance / distance
-            distance = max_distance
-        
-        # Convert to normalized coordinates
-        raw_x = dx / max_distance if max_distance > 0 else 0
-        raw_y = dy / max_distance if max_distance > 0 else 0
+        # Calculate the distance from center (geometry is cached by resizeEvent)
+        g = self._geom
+        dx = mouse_x - g.center_x
+        dy = g.center_y - mouse_y  # Invert Y for logical coordinates
+        
+        # Clamp to the outer ring; the sqrt is only needed when outside it
+        distance_sq = dx*dx + dy*dy
+        handle_range_sq = g.handle_range_sq
+        if distance_sq > handle_range_sq:
+            scale = g.handle_range / _sqrt(distance_sq)
+            dx *= scale
+            dy *= scale
+            distance_sq = handle_range_sq
+        
+        # Convert to normalized coordinates (zero when there is no travel)
+        inv_handle_range = g.inv_handle_range
+        raw_x = dx * inv_handle_range
+        raw_y = dy * inv_handle_range
+        raw_distance_sq = distance_sq * g.inv_handle_range_sq
         
         # Apply dead zones
-        x, y = self._apply_dead_zone(raw_x, raw_y)
+        x, y = self._apply_dead_zone(raw_x, raw_y, raw_distance_sq)
         
         # Apply exponential response
-        x, y = self._apply_exponential(x, y)
+        if self._expo_enabled:
+            x, y = self._apply_exponential(x, y)
         
-        # Update position if changed
-        if (x, y) != self._position:
+        # Update position if changed; the repaint waits for the next timer tick.
+        # Compare the scalars rather than building a tuple just to compare it
+        old_x, old_y = self._position
+        if x != old_x or y != old_y:
             self._position = (x, y)
-            self.update()
+            self._dirty = True
             # Only emit signal if requested and not in dead zone
             if emit_signal and not self._is_in_dead_zone:
-                self.positionChanged.emit(x, y)
+                self._emit_if_changed(x, y)
     
     def set_position(self, x: float, y: float):
         """Set the joystick position programmatically.
@@ -729,14 +975,15 @@ class JoystickWidget(QWidget):
         x, y = self._apply_dead_zone(x, y)
         
         # Apply exponential
-        x, y = self._apply_exponential(x, y)
+        if self._expo_enabled:
+            x, y = self._apply_exponential(x, y)
         
         # Update if changed
         if (x, y) != self._position:
             self._position = (x, y)
-            self.update()
+            self._update_handle()
             if not self._is_in_dead_zone:
-                self.positionChanged.emit(x, y)
+                self._emit_if_changed(x, y)
     
     def paintEvent(self, event):
         """Draw the joystick widget.
@@ -744,269 +991,389 @@ class JoystickWidget(QWidget):
         Args:
             event: Paint event
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Calculate the dimensions
-        width = self.width()
-        height = self.height()
-        size = min(width, height)
-        
-        center_x = width // 2
-        center_y = height // 2
-        radius = size // 2
-        
-        # Draw the outer border (circle)
-        painter.setPen(QPen(QColor(100, 100, 100), 2))
-        painter.setBrush(QBrush(QColor(50, 50, 50)))
-        
-        outer_rect = QRect((width - size) // 2, (height - size) // 2, size, size)
-        painter.drawEllipse(outer_rect)
-        
-        # Draw exponential response visualization if enabled
-        if self._exponential_x > 1.0 or self._exponential_y > 1.0:
-            self._draw_exponential_visualization(painter, center_x, center_y, radius)
+        # Nothing to draw while hidden (e.g. on an inactive tab)
+        if not self.isVisible():
+            return
         
-        # Draw the circular dead zone if it's set
-        if self._dead_zone > 0.0:
-            # Calculate the dead zone radius
-            dead_zone_radius = int(radius * self._dead_zone)
-            
-            # Create a semi-transparent red for the dead zone
-            dead_zone_color = QColor(255, 0, 0, 40)  # Red with 40/255 alpha (translucent)
-            painter.setPen(QPen(QColor(255, 0, 0, 100), 1))  # Slightly more opaque red for the border
-            painter.setBrush(QBrush(dead_zone_color))
-            
-            # Draw the dead zone circle
-            dead_zone_rect = QRect(
-                center_x - dead_zone_radius, 
-                center_y - dead_zone_radius,
-                dead_zone_radius * 2,
-                dead_zone_radius * 2
-            )
-            painter.drawEllipse(dead_zone_rect)
-            
-        # Draw X-axis dead zone if set
-        if self._dead_zone_x > 0.0:
-            # Calculate the dead zone width
-            x_dead_zone_width = int(radius * self._dead_zone_x)
-            
-            # Create a semi-transparent yellow for the X dead zone
-            x_dead_zone_color = QColor(255, 255, 0, 30)  # Yellow with 30/255 alpha
-            painter.setPen(QPen(QColor(255, 255, 0, 80), 1))  # More opaque yellow for border
-            painter.setBrush(QBrush(x_dead_zone_color))
-            
-            # Draw the X-axis dead zone rectangle
-            x_dead_zone_rect = QRect(
-                center_x - x_dead_zone_width,
-                center_y - radius + 5,
-                x_dead_zone_width * 2,
-                2 * radius - 10
-            )
-            painter.drawRect(x_dead_zone_rect)
-            
-        # Draw Y-axis dead zone if set
-        if self._dead_zone_y > 0.0:
-            # Calculate the dead zone height
-            y_dead_zone_height = int(radius * self._dead_zone_y)
-            
-            # Create a semi-transparent green for the Y dead zone
-            y_dead_zone_color = QColor(0, 255, 0, 30)  # Green with 30/255 alpha
-            painter.setPen(QPen(QColor(0, 255, 0, 80), 1))  # More opaque green for border
-            painter.setBrush(QBrush(y_dead_zone_color))
-            
-            # Draw the Y-axis dead zone rectangle
-            y_dead_zone_rect = QRect(
-                center_x - radius + 5,
-                center_y - y_dead_zone_height,
-                2 * radius - 10,
-                y_dead_zone_height * 2
-            )
-            painter.drawRect(y_dead_zone_rect)
-
-        # Draw X and Y axes
-        painter.setPen(QPen(QColor(180, 180, 180), 1))
-        # X-axis (horizontal line)
-        painter.drawLine(center_x - radius + 5, center_y, center_x + radius - 5, center_y)
-        # Y-axis (vertical line)
-        painter.drawLine(center_x, center_y - radius + 5, center_x, center_y + radius - 5)
+        painter = QPainter(self)
         
-        # Draw the center position marker
-        painter.setPen(QPen(QColor(150, 150, 150), 1))
+        # Everything but the handle is pre-rendered, and only changes with size or config
+        if self._bg_pixmap is None:
+            self._rebuild_background()
+        painter.drawPixmap(0, 0, self._bg_pixmap)
         
-        # Draw crosshair at center
-        painter.drawLine(center_x - 5, center_y, center_x + 5, center_y)
-        painter.drawLine(center_x, center_y - 5, center_x, center_y + 5)
+        painter.setRenderHint(QPainter.Antialiasing)
+        g = self._geom
+        center_x = g.center_x
+        center_y = g.center_y
         
         # Calculate the handle position
         x, y = self._position
-        handle_x = center_x + int(x * (size // 2 - self._handle_radius))
-        handle_y = center_y - int(y * (size // 2 - self._handle_radius))  # Invert Y for screen coords
+        handle_x = center_x + int(x * g.handle_range)
+        handle_y = center_y - int(y * g.handle_range)  # Invert Y for screen coords
         
-        # Set handle color based on whether it's in a dead zone
-        if self._is_in_dead_zone:
-            handle_color = QColor(200, 100, 100)  # Reddish when in dead zone
-        elif self._is_in_x_dead_zone:
-            handle_color = QColor(200, 200, 100)  # Yellowish when in X dead zone
-        elif self._is_in_y_dead_zone:
-            handle_color = QColor(100, 200, 100)  # Greenish when in Y dead zone
-        else:
-            handle_color = QColor(100, 150, 255)  # Bluish when outside all dead zones
-        
-        # Draw the handle
-        painter.setPen(QPen(QColor(200, 200, 200), 2))
-        painter.setBrush(QBrush(handle_color))
-        painter.drawEllipse(QPoint(handle_x, handle_y), self._handle_radius, self._handle_radius)
+        # Draw the handle, colored by whether it's in a dead zone
+        ratio = self.devicePixelRatioF()
+        if ratio != self._handle_pixmap_ratio:
+            self._build_handle_pixmaps(ratio)
+        offset = self._handle_radius + 2
+        painter.drawPixmap(handle_x - offset, handle_y - offset,
+                           self._handle_pixmaps[self._handle_state()])
         
         # Draw connection line from center to handle
-        painter.setPen(QPen(QColor(150, 150, 150), 1, Qt.DashLine))
+        painter.setPen(_PEN_CONNECTION)
         painter.drawLine(center_x, center_y, handle_x, handle_y)
         
         # Display current coordinates near the handle
-        painter.setPen(QColor(255, 255, 255))
-        coord_text = f"({x:.2f}, {y:.2f})"
-        
-        # Add indicator for current state
+        # Partial repaints often redraw an unchanged position, so reuse the text
+        if self._position != self._coord_key:
+            self._coord_key = self._position
+            self._coord_text = f"({x:.2f}, {y:.2f})"
+            self._coord_width = self._metrics.horizontalAdvance(self._coord_text)
+        painter.setPen(_PEN_TEXT)
+        text_x = handle_x + 15
+        painter.drawText(text_x, handle_y, self._coord_text)
+        
+        # Add indicator for current state; these only change with config, so
+        # they are drawn from pre-rendered pixmaps
         if self._is_in_dead_zone:
-            coord_text += " [DEAD ZONE]"
+            state_text = " [DEAD ZONE]"
         elif self._is_in_x_dead_zone:
-            coord_text += " [X DEAD]"
+            state_text = " [X DEAD]"
         elif self._is_in_y_dead_zone:
-            coord_text += " [Y DEAD]"
-        elif self._exponential_x > 1.0 or self._exponential_y > 1.0:
+            state_text = " [Y DEAD]"
+        elif self._expo_enabled:
             # Show percentage values instead of raw factors
             x_percent = self._exponential_x_percent
             y_percent = self._exponential_y_percent
-            coord_text += f" [EXP {x_percent:.0f}%,{y_percent:.0f}%]"
+            state_text = f" [EXP {x_percent:.0f}%,{y_percent:.0f}%]"
+        else:
+            state_text = None
             
-        painter.drawText(handle_x + 15, handle_y, coord_text)
+        if state_text is not None:
+            text_x += self._coord_width
+            self._draw_label(painter, text_x, handle_y, state_text, _COLOR_TEXT)
     
-    def _draw_exponential_visualization(self, painter, center_x, center_y, radius):
-        """Draw visualization of exponential response curve.
+    def _rebuild_background(self):
+        """Render the static parts of the joystick into the background pixmap.
         
-        Args:
-            painter: QPainter instance
-            center_x: X center of the joystick
-            center_y: Y center of the joystick
-            radius: Radius of the joystick area
+        This covers the outer circle, the expo curves, the dead zones, the axes and
+        the center crosshair, which only change on resize or configuration changes.
         """
-        # Save current painter state
-        painter.save()
+        # Rasterize on an in-process QImage; on X11 painting a QPixmap directly can
+        # go through the server, so convert to a pixmap only once at the end
+        ratio = self.devicePixelRatioF()
+        image = QImage(ceil(self.width() * ratio), ceil(self.height() * ratio),
+                       QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(ratio)
+        # Opaque fill in place of the erase skipped by WA_OpaquePaintEvent
+        image.fill(self.palette().color(self.backgroundRole()))
+        
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
         
-        # Use smaller radius for curves to ensure they stay within the circle
-        curve_radius = int(radius * 0.85)
+        # Geometry is cached by resizeEvent
+        g = self._geom
         
-        # Use semi-transparent colors for better visibility
-        x_curve_color = QColor(255, 80, 80, 180)  # Red with some transparency
-        y_curve_color = QColor(80, 80, 255, 180)  # Blue with some transparency
+        # Draw the outer border (circle)
+        painter.setPen(_PEN_BORDER)
+        painter.setBrush(_BRUSH_BACKGROUND)
+        painter.drawEllipse(g.outer_rect)
         
-        # Create a clipping path to limit drawing to inside the circle
-        clip_path = QPainterPath()
-        clip_path.addEllipse(center_x - radius, center_y - radius, radius * 2, radius * 2)
-        painter.setClipPath(clip_path)
+        # Draw exponential response visualization if enabled
+        if self._expo_enabled:
+            self._draw_exponential_visualization(painter, g)
         
-        # Draw X-axis exponential grid if enabled
-        if self._exponential_x_percent > 0.0:
-            # Set pen to a solid red line for the curve
-            painter.setPen(QPen(x_curve_color, 2, Qt.SolidLine))
-            
-            # Create a path for the exponential curve using the standard expo formula
-            path = QPainterPath()
-            
-            # Draw X-axis curve
-            points = []
-            expo_factor = self._exponential_x_percent / 100.0  # Convert to 0-1 range
+        # Draw the circular dead zone if it's set
+        if self._has_circular_dead_zone:
+            # Semi-transparent red for the dead zone
+            painter.setPen(_PEN_DEAD_ZONE)
+            painter.setBrush(_BRUSH_DEAD_ZONE)
+            painter.drawEllipse(g.dead_zone_rect)
+        
+        # The rest is axis-aligned rects and lines, which antialiasing only blurs
+        painter.setRenderHint(QPainter.Antialiasing, False)
             
-            # Add many points to make the curve smooth
-            for i in range(101):
-                # Input from -1.0 to 1.0
-                input_x = -1.0 + (i * 0.02)
-                
-                # Calculate output using the standard expo formula
-                sign_x = 1.0 if input_x > 0.0 else -1.0
-                abs_x = abs(input_x)
-                # Standard expo formula: linear blend with cubic
-                output_x = sign_x * (abs_x * (1.0 - expo_factor) + (abs_x ** 3) * expo_factor)
-                
-                # Calculate pixel positions (using smaller curve_radius to avoid edge overlap)
-                px = center_x + int(input_x * curve_radius)  # X position based on input
-                py = center_y - int(output_x * curve_radius)  # Y position based on output (inverted)
-                
-                points.append((px, py))
+        # Draw X-axis dead zone if set
+        if self._has_dead_zone_x:
+            # Semi-transparent yellow for the X dead zone
+            painter.setPen(_PEN_X_DEAD_ZONE)
+            painter.setBrush(_BRUSH_X_DEAD_ZONE)
+            painter.drawRect(g.x_dead_zone_rect)
             
-            # Create the path
-            if points:
-                path.moveTo(points[0][0], points[0][1])
-                for px, py in points[1:]:
-                    path.lineTo(px, py)
-                    
-            painter.drawPath(path)
+        # Draw Y-axis dead zone if set
+        if self._has_dead_zone_y:
+            # Semi-transparent green for the Y dead zone
+            painter.setPen(_PEN_Y_DEAD_ZONE)
+            painter.setBrush(_BRUSH_Y_DEAD_ZONE)
+            painter.drawRect(g.y_dead_zone_rect)
+
+        # Draw X and Y axes
+        painter.setPen(_PEN_AXES)
+        painter.drawLine(g.x_axis_line)
+        painter.drawLine(g.y_axis_line)
+        
+        # Draw crosshair at center
+        painter.setPen(_PEN_CROSSHAIR)
+        painter.drawLines(*g.crosshair_lines)
+        
+        painter.end()
+        self._bg_pixmap = QPixmap.fromImage(image)
+    
+    def _draw_label(self, painter, x, y, text, color):
+        """Draw fixed label text from a cached pixmap.
+        
+        Args:
+            painter: QPainter instance
+            x: X position of the text start
+            y: Y position of the text baseline
+            text: Label text
+            color: Text color
+        """
+        pixmap = self._get_label_pixmap(text, color)
+        painter.drawPixmap(x, y - self._metrics.ascent(), pixmap)
+    
+    def _get_label_pixmap(self, text: str, color: QColor) -> QPixmap:
+        """Render label text to a transparent pixmap, memoized per text and color.
+        
+        Args:
+            text: Label text
+            color: Text color
             
-            # Draw small label to indicate X-axis expo (moved inside for better positioning)
-            painter.setPen(QPen(x_curve_color, 1))
-            # Position label closer to the center to ensure it stays inside the circle
-            label_x = center_x + int(curve_radius * 0.5)
-            label_y = center_y - int(curve_radius * 0.5)
-            painter.drawText(label_x, label_y, f"X:{self._exponential_x_percent:.0f}%")
+        Returns:
+            Pixmap with the text drawn on its baseline
+        """
+        key = (text, color.rgba())
+        pixmap = self._label_cache.get(key)
+        if pixmap is None:
+            if len(self._label_cache) >= _LABEL_CACHE_LIMIT:
+                self._label_cache.clear()
             
-        # Draw Y-axis exponential grid if enabled
-        if self._exponential_y_percent > 0.0:
-            # Set pen to a solid blue line for the curve (to distinguish from X)
-            painter.setPen(QPen(y_curve_color, 2, Qt.SolidLine))
+            metrics = self._metrics
+            ratio = self.devicePixelRatioF()
+            width = metrics.horizontalAdvance(text) + 2  # Room for antialiasing overhang
+            height = metrics.height()
+            pixmap = QPixmap(ceil(width * ratio), ceil(height * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
             
-            # Create a path for the exponential curve using the standard expo formula
-            path = QPainterPath()
+            label_painter = QPainter(pixmap)
+            label_painter.setFont(self.font())
+            label_painter.setPen(color)
+            label_painter.drawText(0, metrics.ascent(), text)
+            label_painter.end()
             
-            # Draw Y-axis curve
-            points = []
-            expo_factor = self._exponential_y_percent / 100.0  # Convert to 0-1 range
+            self._label_cache[key] = pixmap
+        return pixmap
+    
+    def changeEvent(self, event):
+        """Drop pre-rendered labels and background when the font or palette changes.
+        
+        Args:
+            event: Change event
+        """
+        event_type = event.type()
+        if event_type == QEvent.FontChange:
+            self._metrics = self.fontMetrics()
+            self._coord_key = None
+            self._label_cache.clear()
+            self._bg_pixmap = None
+        elif event_type == QEvent.PaletteChange:
+            # The background fill comes from the palette
+            self._bg_pixmap = None
+        super().changeEvent(event)
+    
+    def _build_handle_pixmaps(self, ratio: float):
+        """Pre-render the handle once per state color.
+        
+        Args:
+            ratio: Device pixel ratio to render at
+        """
+        r = self._handle_radius
+        size = 2 * r + 4  # Room for the outline
+        pixmaps = []
+        for brush in _HANDLE_BRUSHES:
+            pixmap = QPixmap(ceil(size * ratio), ceil(size * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
             
-            # Add many points to make the curve smooth
-            for i in range(101):
-                # Input from -1.0 to 1.0
-                input_y = -1.0 + (i * 0.02)
-                
-                # Calculate output using the standard expo formula
-                sign_y = 1.0 if input_y > 0.0 else -1.0
-                abs_y = abs(input_y)
-                # Standard expo formula: linear blend with cubic
-                output_y = sign_y * (abs_y * (1.0 - expo_factor) + (abs_y ** 3) * expo_factor)
-                
-                # Calculate pixel positions (using smaller curve_radius to avoid edge overlap)
-                px = center_x + int(output_y * curve_radius)  # X position based on output
-                py = center_y - int(input_y * curve_radius)  # Y position based on input (inverted)
-                
-                points.append((px, py))
+            handle_painter = QPainter(pixmap)
+            handle_painter.setRenderHint(QPainter.Antialiasing)
+            handle_painter.setPen(_PEN_HANDLE)
+            handle_painter.setBrush(brush)
+            handle_painter.drawEllipse(QPoint(r + 2, r + 2), r, r)
+            handle_painter.end()
             
-            # Create the path
-            if points:
-                path.moveTo(points[0][0], points[0][1])
-                for px, py in points[1:]:
-                    path.lineTo(px, py)
-                    
-            painter.drawPath(path)
+            pixmaps.append(pixmap)
+        self._handle_pixmaps = tuple(pixmaps)
+        self._handle_pixmap_ratio = ratio
+    
+    def _handle_state(self) -> int:
+        """Classify the handle by the dead zone it is in, for coloring.
+        
+        Returns:
+            One of the _HANDLE_STATE_* constants
+        """
+        if self._is_in_dead_zone:
+            return _HANDLE_STATE_DEAD
+        if self._is_in_x_dead_zone:
+            return _HANDLE_STATE_X_DEAD
+        if self._is_in_y_dead_zone:
+            return _HANDLE_STATE_Y_DEAD
+        return _HANDLE_STATE_NONE
+    
+    def _draw_exponential_visualization(self, painter, g):
+        """Draw visualization of exponential response curve.
+        
+        Args:
+            painter: QPainter instance
+            g: Current joystick geometry
+        """
+        if not self._expo_enabled:
+            return
+        
+        center_x = g.center_x
+        center_y = g.center_y
+        curve_radius = g.curve_radius
+        
+        # Rebuild the cached curves if expo settings or geometry changed
+        cache_key = (center_x, center_y, curve_radius)
+        if cache_key != self._expo_cache_key:
+            self._rebuild_expo_polylines(center_x, center_y, curve_radius)
+            self._expo_cache_key = cache_key
+        
+        # Only the pen and clip are changed below, so restore just those rather
+        # than paying for a full save()/restore() of the painter state
+        old_pen = painter.pen()
+        
+        # Limit drawing to inside the circle (clip region is cached by resizeEvent)
+        painter.setClipRegion(g.clip_region)
+        
+        draw_x = self._has_expo_x
+        draw_y = self._has_expo_y
+        
+        # Draw the curves first: solid red for X, solid blue for Y (to distinguish from X)
+        if draw_x:
+            painter.setPen(_PEN_X_CURVE)
+            painter.drawPolyline(self._expo_x_polyline)
+        if draw_y:
+            painter.setPen(_PEN_Y_CURVE)
+            painter.drawPolyline(self._expo_y_polyline)
             
-            # Draw small label to indicate Y-axis expo (moved inside for better positioning)
-            painter.setPen(QPen(y_curve_color, 1))
-            # Position label closer to the center to ensure it stays inside the circle
-            label_x = center_x - int(curve_radius * 0.3)
-            label_y = center_y - int(curve_radius * 0.5)
-            painter.drawText(label_x, label_y, f"Y:{self._exponential_y_percent:.0f}%")
+        # Draw 1:1 reference line (diagonal) with a dotted light gray line, when
+        # both curves are shown for comparison
+        if draw_x and draw_y:
+            painter.setPen(_PEN_REFERENCE)
+            painter.drawLine(self._expo_reference_line)
+        
+        # Draw the labels last, closer to the center to ensure they stay inside the circle
+        label_y = center_y - int(curve_radius * 0.5)
+        if draw_x:
+            self._draw_label(painter, center_x + int(curve_radius * 0.5), label_y,
+                             f"X:{self._exponential_x_percent:.0f}%", _COLOR_X_CURVE)
+        if draw_y:
+            self._draw_label(painter, center_x - int(curve_radius * 0.3), label_y,
+                             f"Y:{self._exponential_y_percent:.0f}%", _COLOR_Y_CURVE)
+        
+        # Remove the clipping path and hand back the caller's pen; the curves
+        # aren't filled, so the brush was never touched
+        painter.setClipping(False)
+        painter.setPen(old_pen)
+    
+    def _rebuild_expo_polylines(self, center_x, center_y, curve_radius):
+        """Rebuild the cached exponential response curves and 1:1 reference line.
+        
+        Args:
+            center_x: X center of the joystick
+            center_y: Y center of the joystick
+            curve_radius: Radius the curves are scaled to
+        """
+        self._expo_x_polyline = None
+        self._expo_y_polyline = None
+        self._expo_reference_line = QLine(center_x - curve_radius, center_y + curve_radius,
+                                          center_x + curve_radius, center_y - curve_radius)
+        if self._has_expo_x:
+            self._expo_x_polyline = self._build_expo_polyline(
+                self._expo_factor_x, center_x, center_y, curve_radius, False)
+        if self._has_expo_y:
+            self._expo_y_polyline = self._build_expo_polyline(
+                self._expo_factor_y, center_x, center_y, curve_radius, True)
+    
+    @staticmethod
+    def _build_expo_polyline(expo_factor, center_x, center_y, curve_radius, swap_axes):
+        """Build the response curve for one axis using the standard expo formula.
+        
+        Args:
+            expo_factor: Normalized expo factor (0-1)
+            center_x: X center of the joystick
+            center_y: Y center of the joystick
+            curve_radius: Radius the curve is scaled to
+            swap_axes: False to plot output against input horizontally (X axis),
+                True to plot input against output vertically (Y axis)
             
-        # Draw 1:1 reference line (diagonal) with a dotted light gray line
-        if self._exponential_x_percent > 0.0 or self._exponential_y_percent > 0.0:
-            painter.setPen(QPen(QColor(150, 150, 150, 80), 1, Qt.DotLine))
-            painter.drawLine(center_x - curve_radius, center_y + curve_radius, 
-                            center_x + curve_radius, center_y - curve_radius)
-        
-        # Restore painter state (which also removes the clipping path)
-        painter.restore()
-    
-    def __del__(self):
-        """Destructor to clean up resources."""
-        # Stop the update timer if running
-        if self._update_timer.isActive():
-            self._update_timer.stop()
+        Returns:
+            QPolygonF through 101 samples of the curve
+        """
+        # Standard expo formula over all samples at once: linear blend with cubic
+        output = _EXPO_INPUT + expo_factor * _EXPO_CUBIC_DELTA
+        
+        # Pixel offsets, truncated toward zero like int()
+        input_offsets = (_EXPO_INPUT * curve_radius).astype(np.int32)
+        output_offsets = (output * curve_radius).astype(np.int32)
+        
+        # QPolygonF stores its points as interleaved doubles (x0, y0, x1, y1, ...),
+        # so view its buffer as an array and write the pixel positions straight
+        # into alternating slots (screen Y is inverted)
+        polygon = QPolygonF(len(_EXPO_INPUT))
+        buffer = polygon.data()
+        buffer.setsize(2 * len(_EXPO_INPUT) * np.dtype(np.float64).itemsize)
+        coords = np.frombuffer(buffer, dtype=np.float64)
+        if swap_axes:
+            np.add(center_x, output_offsets, out=coords[0::2])
+            np.subtract(center_y, input_offsets, out=coords[1::2])
+        else:
+            np.add(center_x, input_offsets, out=coords[0::2])
+            np.subtract(center_y, output_offsets, out=coords[1::2])
+        
+        return polygon
+
+
+def _configure_return_mode(joystick: JoystickWidget, config: Dict):
+    """Apply the return-to-center settings from a config dictionary.
+    
+    Args:
+        joystick: Joystick widget to configure
+        config: Configuration with 'return_mode' and/or legacy 'return_to_center'
+    """
+    return_mode = RETURN_MODE_BOTH  # Default behavior
+    
+    # Check for legacy return_to_center parameter
+    if 'return_to_center' in config:
+        return_mode = RETURN_MODE_BOTH if config['return_to_center'] else RETURN_MODE_NONE
+    
+    # Check for the newer return_mode parameter (overrides return_to_center)
+    mode = config.get('return_mode')
+    if mode in (RETURN_MODE_NONE, RETURN_MODE_HORIZONTAL, RETURN_MODE_VERTICAL, RETURN_MODE_BOTH):
+        return_mode = mode
+    
+    joystick.set_return_mode(return_mode)
+
+
+def _configure_update_rate(joystick: JoystickWidget, config: Dict):
+    """Apply the update rate from a config dictionary.
+    
+    Args:
+        joystick: Joystick widget to configure
+        config: Configuration with 'update_frequency' (Hz) or legacy 'update_interval' (ms)
+    """
+    if 'update_frequency' in config:
+        joystick.set_update_frequency(float(config['update_frequency']))
+    else:
+        # For backward compatibility with update_interval
+        interval_ms = int(config['update_interval'])
+        # Convert from interval in ms to frequency in Hz
+        if interval_ms > 0:
+            joystick.set_update_frequency(1000 / interval_ms)
 
 
 class JoystickParameter(Parameter):
@@ -1022,6 +1389,20 @@ class JoystickParameter(Parameter):
         config (dict): Configuration dictionary with all settings
     """
     
+    # Widget setters run when any of their config keys is present, shared by
+    # __init__ and set_config; settings whose keys are absent are left unchanged
+    _CONFIG_HANDLERS = {
+        ('return_to_center', 'return_mode'): _configure_return_mode,
+        ('dead_zone',): lambda joystick, config: joystick.set_dead_zone(float(config['dead_zone'])),
+        ('dead_zone_x', 'dead_zone_y'): lambda joystick, config: joystick.set_axis_dead_zones(
+            float(config.get('dead_zone_x', 0.0)), float(config.get('dead_zone_y', 0.0))),
+        # Percentage-based expo values (0-100%)
+        ('exponential_x', 'exponential_y'): lambda joystick, config: joystick.set_exponential(
+            float(config.get('exponential_x', 0.0)), float(config.get('exponential_y', 0.0))),
+        ('update_frequency', 'update_interval'): _configure_update_rate,
+        ('size',): lambda joystick, config: joystick.setFixedSize(config['size'], config['size']),
+    }
+    
     def __init__(self, name: str = "Unnamed", config: Optional[Dict] = None) -> None:
         """Initialize the joystick parameter widget.
         
@@ -1055,11 +1436,6 @@ class JoystickParameter(Parameter):
         # Create the joystick widget
         self.joystick = JoystickWidget()
         
-        # Set custom size if provided
-        if 'size' in config:
-            size = config['size']
-            self.joystick.setFixedSize(size, size)
-            
         # Set initial position
         x_initial = config.get('x_initial', 0.0)
         y_initial = config.get('y_initial', 0.0)
@@ -1068,54 +1444,8 @@ class JoystickParameter(Parameter):
         self.value = initial_pos
         self.joystick.set_position(*initial_pos)
         
-        # Configure return-to-center behavior
-        return_mode = RETURN_MODE_BOTH  # Default behavior
-
-        # Check for legacy return_to_center parameter
-        if 'return_to_center' in config:
-            if config['return_to_center']:
-                return_mode = RETURN_MODE_BOTH
-            else:
-                return_mode = RETURN_MODE_NONE
-
-        # Check for the newer return_mode parameter (overrides return_to_center)
-        if 'return_mode' in config:
-            mode = config['return_mode']
-            if mode in (RETURN_MODE_NONE, RETURN_MODE_HORIZONTAL, RETURN_MODE_VERTICAL, RETURN_MODE_BOTH):
-                return_mode = mode
-                
-        self.joystick.set_return_mode(return_mode)
-        
-        # Configure circular dead zone if provided
-        if 'dead_zone' in config:
-            dead_zone = float(config['dead_zone'])
-            self.joystick.set_dead_zone(dead_zone)
-            
-        # Configure axis-specific dead zones if provided
-        dead_zone_x = config.get('dead_zone_x', 0.0)
-        dead_zone_y = config.get('dead_zone_y', 0.0)
-        if dead_zone_x > 0.0 or dead_zone_y > 0.0:
-            self.joystick.set_axis_dead_zones(float(dead_zone_x), float(dead_zone_y))
-            
-        # Configure exponential response if provided
-        # Use percentage-based expo values (0-100%)
-        expo_x_percent = config.get('exponential_x', 0.0)
-        expo_y_percent = config.get('exponential_y', 0.0)
-            
-        if expo_x_percent > 0.0 or expo_y_percent > 0.0:
-            self.joystick.set_exponential(float(expo_x_percent), float(expo_y_percent))
-            
-        # Configure update frequency if provided (new approach using Hz)
-        if 'update_frequency' in config:
-            frequency = float(config['update_frequency'])
-            self.joystick.set_update_frequency(frequency)
-        # For backward compatibility with update_interval
-        elif 'update_interval' in config:
-            interval_ms = int(config['update_interval'])
-            # Convert from interval in ms to frequency in Hz
-            if interval_ms > 0:
-                frequency = 1000 / interval_ms
-                self.joystick.set_update_frequency(frequency)
+        # Apply size, return mode, dead zones, expo and update rate
+        self._apply_config(config)
         
         # Connect signals
         self.joystick.positionChanged.connect(self._on_position_changed)
@@ -1123,8 +1453,8 @@ class JoystickParameter(Parameter):
         # Add joystick to layout
         joystick_layout.addWidget(self.joystick)
         
-        # Add to main layout (after the label from parent class)
-        self.layout.addLayout(joystick_layout)
+        # Add to the content layout from the base class
+        self.working_layout.addLayout(joystick_layout)
     
     def _on_position_changed(self, x: float, y: float) -> None:
         """Handle position changes from the joystick.
@@ -1134,7 +1464,7 @@ class JoystickParameter(Parameter):
             y: Y position (-1.0 to 1.0)
         """
         self.value = (x, y)
-        self.valueChanged.emit(self.name, self.value)
+        self._emit_value(self.value)
     
     def set_value(self, value: Tuple[float, float]):
         """Set the joystick parameter value.
@@ -1165,22 +1495,24 @@ class JoystickParameter(Parameter):
         super().set_config(config)
         
         # Update the joystick widget configuration
-        self.joystick.set_return_mode(config.get('return_mode', RETURN_MODE_BOTH))
-        self.joystick.set_dead_zone(config.get('dead_zone', 0.0))
-        self.joystick.set_axis_dead_zones(config.get('dead_zone_x', 0.0), config.get('dead_zone_y', 0.0))
-        self.joystick.set_exponential(config.get('exponential_x', 1.0), config.get('exponential_y', 1.0))
-        self.joystick.set_update_frequency(config.get('update_frequency', 10.0))
-        
-        # Update size if specified
-        if 'size' in config:
-            size = config['size']
-            self.joystick.setFixedSize(size, size)
+        self._apply_config(config)
         
         # Update initial position
         x_initial = config.get('x_initial', 0.0)
         y_initial = config.get('y_initial', 0.0)
         self.joystick.set_position(float(x_initial), float(y_initial))
     
+    def _apply_config(self, config: Dict):
+        """Run the joystick setters for the keys present in a config dictionary.
+        
+        Args:
+            config: Configuration dictionary with keys as described in __init__
+        """
+        joystick = self.joystick
+        for keys, handler in self._CONFIG_HANDLERS.items():
+            if any(key in config for key in keys):
+                handler(joystick, config)
+    
     def get_config(self) -> Dict:
         """Get the current configuration of the joystick parameter.
         
@@ -4,12 +4,41 @@ This module provides the Parameter class (formerly ParameterWidget),
 which serves as the base class for all parameter widgets in PyQt Live Tuner.
 """
 
-from PyQt5.QtWidgets import QWidget, QLabel, QHBoxLayout, QVBoxLayout
+from PyQt5.QtWidgets import QWidget, QLabel, QBoxLayout, QHBoxLayout
 from PyQt5.QtCore import pyqtSignal, Qt
 from typing import Any, Dict, Optional, Callable, List, Literal
+from abc import ABCMeta, abstractmethod
+from types import MappingProxyType
 
+# Shared read-only config for parameters created without one, instead of a
+# fresh empty dict per instance
+_EMPTY_CONFIG = MappingProxyType({})
 
-class Parameter(QWidget):
+# Qt alignment flags for each label_alignment option, combined once at import
+# as Qt.Alignment so setAlignment gets them without per-call conversion
+_ALIGN = {
+    'left': Qt.Alignment(Qt.AlignLeft | Qt.AlignVCenter),
+    'center': Qt.Alignment(Qt.AlignCenter),
+    'right': Qt.Alignment(Qt.AlignRight | Qt.AlignVCenter),
+}
+_ALIGN_DEFAULT = _ALIGN['left']
+
+# Main layout direction for each label_position option
+_LABEL_DIRECTION = {
+    'top': QBoxLayout.TopToBottom,
+    'bottom': QBoxLayout.TopToBottom,
+    'left': QBoxLayout.LeftToRight,
+    'right': QBoxLayout.LeftToRight,
+}
+
+# Main layout index the label is inserted at; -1 appends it after the content
+_LABEL_INDEX = {'top': 0, 'left': 0, 'bottom': -1, 'right': -1}
+
+class _ParameterMeta(type(QWidget), ABCMeta):
+    """Metaclass combining sip's wrapper type with ABCMeta for abstract methods."""
+
+
+class Parameter(QWidget, metaclass=_ParameterMeta):
     """Base class for parameter widgets in PyQt Live Tuner.
     
     This class provides common functionality for all parameter widgets,
@@ -18,7 +47,8 @@ class Parameter(QWidget):
     Attributes:
         name (str): The name of the parameter
         label (QLabel): The label widget displaying the parameter name (None if label is disabled)
-        layout (QHBoxLayout or QVBoxLayout): The layout for the parameter widget
+        working_layout (QHBoxLayout): The layout subclasses add their widgets to; it
+            sits in the main QBoxLayout (see layout()) next to the label
         valueChanged (pyqtSignal): Signal emitted when the parameter value changes
         
     Label Configuration:
@@ -26,11 +56,12 @@ class Parameter(QWidget):
         - show_label: Make label optional (True/False) - default: False
         - label_position: Position ('left', 'right', 'top', 'bottom') - default: 'left'
         - label_alignment: Alignment ('left', 'right', 'center') - default: 'left'
-        - label_width: Minimum width in pixels - default: 100
+        - label_width: Minimum width in pixels - default: 30
         
     Subclasses should:
     1. Override setup_ui() to add their custom widgets to self.working_layout
-    2. Implement get_value() and set_value() methods
+    2. Implement get_value() and set_value() methods (abstract; a subclass missing
+       either can't be instantiated)
     """
     
     valueChanged = pyqtSignal(str, object)
@@ -45,62 +76,48 @@ class Parameter(QWidget):
                    - show_label: Whether to show the label (default: False)
                    - label_position: Position of label ('left', 'right', 'top', 'bottom') (default: 'left')
                    - label_alignment: Text alignment ('left', 'right', 'center') (default: 'left')
-                   - label_width: Minimum width for the label in pixels (default: 100)
+                   - label_width: Minimum width for the label in pixels (default: 30)
         """
         super().__init__()
         
         self.name = name
-        self.config = config or {}
-        
-        # Determine whether to show label and its position
-        show_label = self.config.get('show_label', False)
-        label_position = self.config.get('label_position', 'left')
-        label_alignment = self.config.get('label_alignment', 'left')
-        label_width = self.config.get('label_width', 30)
-        
-        # Create main layout based on label position
-        if label_position in ('top', 'bottom'):
-            self.layout = QVBoxLayout()
-        else:  # 'left' or 'right'
-            self.layout = QHBoxLayout()
-            
-        self.setLayout(self.layout)
+        self.config = cfg = config if config else _EMPTY_CONFIG
         
-        # Create content layout if needed (for top/bottom label positions)
-        self.content_layout = None
-        if label_position in ('top', 'bottom'):
-            self.content_layout = QHBoxLayout()
-            
-        # Create and configure label if enabled
-        self.label = None
-        if show_label:
-            self.label = QLabel(self.name + ":")
-            self.label.setMinimumWidth(label_width)
+        # Callbacks invoked directly on value changes (see register_callback)
+        self._callbacks: List[Callable[[str, Any], None]] = []
+        self._emitting = False  # Set while _emit_value is notifying listeners
+        
+        # Determine whether to show label and its position; most parameters are
+        # created without a config, so skip the lookups entirely in that case
+        if cfg:
+            get = cfg.get
+            show_label = get('show_label', False)
+            label_position = get('label_position', 'left')
+            label_alignment = get('label_alignment', 'left')
+            label_width = get('label_width', 30)
+            direction = _LABEL_DIRECTION.get(label_position, QBoxLayout.LeftToRight)
+        else:
+            show_label = False
+            label_position = 'left'
+            label_alignment = 'left'
+            label_width = 30
+            direction = QBoxLayout.LeftToRight
+        
+        # Create main layout based on label position; label position changes only
+        # flip its direction, so it is a plain QBoxLayout rather than an H/V box
+        self._layout = QBoxLayout(direction)
+        self.setLayout(self._layout)
+        
+        # Content always lives in its own row, which stays put when the label moves
+        self._content_layout = QHBoxLayout()
+        self._layout.addLayout(self._content_layout)
             
-            # Set alignment
-            if label_alignment == 'center':
-                self.label.setAlignment(Qt.AlignCenter)
-            elif label_alignment == 'right':
-                self.label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            else:  # 'left' is default
-                self.label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                
-            # Add label based on position
-            if label_position == 'top':
-                self.layout.addWidget(self.label)
-                self.layout.addLayout(self.content_layout)
-            elif label_position == 'bottom':
-                self.layout.addLayout(self.content_layout)
-                self.layout.addWidget(self.label)
-            elif label_position == 'left':
-                self.layout.addWidget(self.label)
-            # For 'right' position, label will be added after setup_ui()
+        # The label itself is only built once the widget is first shown (see
+        # _ensure_label), so parameters on panels that are never opened don't pay for it
+        self._label = None
                 
         # Set the working layout (where subclasses will add their widgets)
-        if self.content_layout:
-            self.working_layout = self.content_layout
-        else:
-            self.working_layout = self.layout
+        self.working_layout = self._content_layout
             
         # Store label position and other label settings for later use
         self.label_position = label_position
@@ -108,15 +125,58 @@ class Parameter(QWidget):
         self.label_width = label_width
         self.show_label = show_label
         
-        # Store widgets for reconstruction during label position changes
-        self.content_widgets = []
+        # Call setup_ui for subclasses to add their widgets, with the layout
+        # disabled so the additions are laid out once rather than one by one.
+        # Most subclasses build their widgets after __init__ instead, so skip
+        # the call when setup_ui isn't overridden
+        if type(self).setup_ui is not Parameter.setup_ui:
+            self._layout.setEnabled(False)
+            try:
+                self.setup_ui()
+            finally:
+                self._layout.setEnabled(True)
+    
+    @property
+    def label(self) -> Optional[QLabel]:
+        """The label displaying the parameter name, or None if the label is disabled.
+        
+        Accessing it builds the label if it hasn't been shown yet.
+        """
+        return self._ensure_label()
+    
+    def _ensure_label(self) -> Optional[QLabel]:
+        """Build the name label and add it to the layout on first use.
         
-        # Call setup_ui for subclasses to add their widgets
-        self.setup_ui()
+        Returns:
+            The label, or None if show_label is False
+        """
+        if self._label is None and self.show_label:
+            label = QLabel(self.name + ":")
+            label.setMinimumWidth(self.label_width)
+            label.setAlignment(_ALIGN.get(self.label_alignment, _ALIGN_DEFAULT))
+            
+            self._place_label(label, self.label_position)
+            self._label = label
+        return self._label
+    
+    def _place_label(self, label: QLabel, position: str) -> None:
+        """Add the label to the main layout before or after the content.
+        
+        Args:
+            label: The name label
+            position: Label position ('left', 'right', 'top', 'bottom')
+        """
+        self._layout.insertWidget(_LABEL_INDEX.get(position, -1), label)
+    
+    def showEvent(self, event):
+        """Build the label, if enabled, before the widget is first painted.
         
-        # Add the right-positioned label after setup_ui if needed
-        if self.label and self.label_position == 'right':
-            self.layout.addWidget(self.label)
+        Args:
+            event: Show event
+        """
+        if self._label is None and self.show_label:
+            self._ensure_label()
+        super().showEvent(event)
     
     def setup_ui(self):
         """Set up the UI components for this parameter.
@@ -126,29 +186,53 @@ class Parameter(QWidget):
         """
         pass
     
+    @abstractmethod
     def get_value(self) -> Any:
         """Get the current value of the parameter.
         
         Returns:
             The current parameter value
         """
-        raise NotImplementedError("Subclasses must implement get_value()")
     
+    @abstractmethod
     def set_value(self, value: Any) -> None:
         """Set the value of the parameter.
         
         Args:
             value: The new value to set
         """
-        raise NotImplementedError("Subclasses must implement set_value()")
     
     def register_callback(self, callback: Callable[[str, Any], None]) -> None:
         """Register a callback function to be called when the value changes.
         
+        Callbacks are called directly rather than through a Qt signal
+        connection. Connect to valueChanged instead when queued
+        (cross-thread) delivery is required.
+        
         Args:
             callback: Function to be called with (name, value) when value changes
         """
-        self.valueChanged.connect(callback)
+        self._callbacks.append(callback)
+    
+    def _emit_value(self, value: Any) -> None:
+        """Notify registered callbacks and valueChanged listeners of a new value.
+        
+        A listener that sets this parameter's value again while being notified
+        doesn't trigger a nested round of notifications.
+        
+        Args:
+            value: The value to report
+        """
+        if self._emitting:
+            return
+        self._emitting = True
+        try:
+            name = self.name
+            for callback in self._callbacks:
+                callback(name, value)
+            self.valueChanged.emit(name, value)
+        finally:
+            self._emitting = False
         
     def set_label_position(self, position: Literal['left', 'right', 'top', 'bottom']) -> None:
         """Dynamically change the label position.
@@ -158,50 +242,33 @@ class Parameter(QWidget):
         """
         if not self.show_label or position == self.label_position:
             return
-            
-        # Store all widgets currently in layouts
-        self._store_content_widgets()
-        
-        # Clear current layouts
-        self._clear_layouts()
-        
-        # Create new layouts based on the new position
-        if position in ('top', 'bottom'):
-            self.layout = QVBoxLayout()
-            self.content_layout = QHBoxLayout()
-        else:  # 'left' or 'right'
-            self.layout = QHBoxLayout()
-            self.content_layout = None
-            
-        self.setLayout(self.layout)
         
-        # Set the working layout
-        if self.content_layout:
-            self.working_layout = self.content_layout
-        else:
-            self.working_layout = self.layout
+        # A label that hasn't been built yet is placed by _ensure_label, so only
+        # the layout direction needs to follow the new position
+        label = self._label
+        
+        # Hold off repaints and layout activation so the moves below land in a
+        # single layout pass
+        self.setUpdatesEnabled(False)
+        self._layout.setEnabled(False)
+        try:
+            direction = _LABEL_DIRECTION.get(position, QBoxLayout.LeftToRight)
+            if direction != self._layout.direction():
+                # Switching between a side and a top/bottom label only changes the
+                # main layout's direction; the content row is never rebuilt
+                self._layout.setDirection(direction)
             
-        # Add label and content based on position
-        if position == 'top':
-            self.layout.addWidget(self.label)
-            self.layout.addLayout(self.content_layout)
-        elif position == 'bottom':
-            self.layout.addLayout(self.content_layout)
-            self.layout.addWidget(self.label)
-        elif position == 'left':
-            self.layout.addWidget(self.label)
-        # For 'right', add content first then label
-        
-        # Restore all content widgets
-        self._restore_content_widgets()
-        
-        # Add right-positioned label if needed
-        if position == 'right':
-            self.layout.addWidget(self.label)
+            # Move the label to the matching end of the layout
+            if label is not None:
+                self._layout.removeWidget(label)
+                self._place_label(label, position)
             
-        # Update stored label position
-        self.label_position = position
-        
+            # Update stored label position
+            self.label_position = position
+        finally:
+            self._layout.setEnabled(True)
+            self.setUpdatesEnabled(True)
+    
     def set_label_alignment(self, alignment: Literal['left', 'center', 'right']) -> None:
         """Set the text alignment of the label.
         
@@ -210,46 +277,9 @@ class Parameter(QWidget):
         """
         if not self.show_label:
             return
-            
-        if alignment == 'center':
-            self.label.setAlignment(Qt.AlignCenter)
-        elif alignment == 'right':
-            self.label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        else:  # 'left' is default
-            self.label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        
+        # An unbuilt label picks up label_alignment when _ensure_label creates it
+        if self._label is not None:
+            self._label.setAlignment(_ALIGN.get(alignment, _ALIGN_DEFAULT))
             
         self.label_alignment = alignment
-        
-    def _store_content_widgets(self) -> None:
-        """Store all content widgets for reconstruction."""
-        self.content_widgets = []
-        
-        # Get the layout containing content widgets
-        source_layout = self.working_layout
-        
-        # Store all widgets
-        for i in range(source_layout.count()):
-            item = source_layout.itemAt(i)
-            if item.widget():
-                self.content_widgets.append(item.widget())
-                
-    def _clear_layouts(self) -> None:
-        """Clear all layouts in preparation for reconstruction."""
-        # Remove all widgets from layouts
-        while self.layout.count():
-            item = self.layout.takeAt(0)
-            if item.widget():
-                # Don't delete the label widget, we'll reuse it
-                if item.widget() != self.label:
-                    item.widget().setParent(None)
-            elif item.layout():
-                # Clear nested layout
-                while item.layout().count():
-                    nested_item = item.layout().takeAt(0)
-                    if nested_item.widget():
-                        nested_item.widget().setParent(None)
-                        
-    def _restore_content_widgets(self) -> None:
-        """Restore all content widgets to the working layout."""
-        for widget in self.content_widgets:
-            self.working_layout.addWidget(widget)
\ No newline at end of file
@@ -5,13 +5,153 @@ This module provides a rotation dial widget and parameter for selecting angles.
 """
 
 import math
+from math import ceil
 from PyQt5.QtWidgets import QWidget, QVBoxLayout
-from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont
-from PyQt5.QtCore import Qt, pyqtSignal, QRect, QPoint, QSize
-from typing import Optional, Dict, Callable, List
+from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPixmap
+from PyQt5.QtCore import (Qt, pyqtSignal, QEvent, QLine, QRect, QPoint, QSize, QTimer,
+                          QElapsedTimer)
+from typing import Optional, Dict, List
+from types import MappingProxyType
+from dataclasses import dataclass
 
+from .._jit import njit, warm_up
 from .parameter import Parameter
 
+# Degree marker angles with their sin/cos, shared by every dial
+_TICK_ANGLES = range(0, 360, 15)
+_TICK_SIN = tuple(math.sin(math.radians(i)) for i in _TICK_ANGLES)
+_TICK_COS = tuple(math.cos(math.radians(i)) for i in _TICK_ANGLES)
+
+# Mouse angles are rounded to 1/20 of a degree, well below the 0.1 degree
+# display precision, so sub-pixel jitter doesn't emit or repaint
+_ANGLE_RESOLUTION = 20
+
+# Drag moves are coalesced to at most one angle update per display frame
+_DRAG_COALESCE_MS = 16
+
+# Minimum time between repaints caused by setters (about 30 Hz), so fast
+# telemetry can't saturate the GUI thread; drags are not limited
+_MIN_REPAINT_MS = 33
+
+# Text offsets of the major angle labels (top, right, bottom, left), which
+# keep the roughly 20x10 pixel labels clear of the tick marks
+_MAJOR_LABEL_OFFSETS = {
+    0: (-10, -5),
+    90: (5, 0),
+    180: (-10, 15),
+    270: (-25, 0)
+}
+
+
+@njit(cache=True)
+def _clamp_wrapped(angle, min_angle, max_angle):
+    """Clamp an angle to the allowed range, which may wrap through 0.
+    
+    Args:
+        angle: Angle in degrees (0-359)
+        min_angle: Minimum allowed angle in degrees
+        max_angle: Maximum allowed angle in degrees
+        
+    Returns:
+        The angle, or the nearest limit if it is outside the range
+    """
+    # Handle wrapping cases for min/max angles
+    min_angle = min_angle % 360
+    max_angle = max_angle % 360
+    
+    if min_angle < max_angle:
+        # Normal case: min is less than max
+        outside = angle < min_angle or angle > max_angle
+    else:
+        # Wrapped case: min is greater than max (e.g. min=330, max=30)
+        outside = angle > max_angle and angle < min_angle
+    
+    if outside:
+        # Clamp to the nearest limit, measuring the short way around the circle
+        to_min = abs(angle - min_angle)
+        to_max = abs(angle - max_angle)
+        if min(to_min, 360 - to_min) < min(to_max, 360 - to_max):
+            return min_angle
+        return max_angle
+    return angle
+
+
+# Paint resources shared by every dial, built once instead of per frame
+_PEN_OUTER = QPen(QColor(100, 100, 100), 2)
+_BRUSH_OUTER = QBrush(QColor(50, 50, 50))
+_PEN_ORIGIN_LINE = QPen(QColor(50, 200, 50, 100), 1, Qt.DashLine)
+_PEN_TICK = QPen(QColor(120, 120, 120), 1)
+_PEN_TICK_ORIGIN = QPen(QColor(50, 180, 50), 1)
+_PEN_TEXT = QPen(QColor(200, 200, 200))
+_COLOR_LIMIT = QColor(200, 100, 50)
+_PEN_LIMIT = QPen(_COLOR_LIMIT, 2)
+_BRUSH_LIMIT = QBrush(_COLOR_LIMIT)
+_PEN_LIMIT_TEXT = QPen(_COLOR_LIMIT)
+_COLOR_NEEDLE = QColor(200, 50, 50)
+_PEN_NEEDLE = QPen(_COLOR_NEEDLE, 2)
+_BRUSH_NEEDLE = QBrush(_COLOR_NEEDLE)
+_BRUSH_CENTER = QBrush(QColor(150, 150, 150))
+_PEN_CURSOR = QPen(QColor(220, 220, 100), 2)
+_PEN_STATUS_BOX = QPen(QColor(100, 100, 100), 1)
+_BRUSH_STATUS_BOX = QBrush(QColor(30, 30, 30, 180))  # Semi-transparent
+_PEN_STATUS_TEXT = QPen(QColor(220, 220, 220), 1)
+_PEN_STATUS_HEADER = QPen(QColor(150, 200, 255), 1)
+
+# Default color and line thickness of each drone status indicator, shared
+# read-only by every dial
+_DEFAULT_STATUS_COLORS = MappingProxyType({
+    'heading': QColor(0, 200, 255),        # Blue
+    'target': QColor(50, 255, 50),         # Green
+    'home': QColor(255, 150, 0),           # Orange
+    'wind': QColor(255, 50, 50),           # Red
+    'velocity': QColor(100, 200, 255),     # Light blue
+    'acceleration': QColor(100, 255, 200), # Light green
+    'gps': QColor(255, 255, 100),          # Yellow
+    'obstacle': QColor(255, 100, 100),     # Light red
+    'custom': QColor(200, 100, 255)        # Purple
+})
+_DEFAULT_STATUS_THICKNESS = MappingProxyType({
+    'heading': 3,
+    'target': 2,
+    'home': 2,
+    'wind': 2,
+    'velocity': 2,
+    'acceleration': 2,
+    'gps': 2,
+    'obstacle': 2,
+    'custom': 2
+})
+
+
+@dataclass
+class _DialGeometry:
+    """Size-derived values used by painting and mouse handling.
+    
+    Rebuilt on resize so the per-frame paths only read fields.
+    
+    Attributes:
+        width (int): Widget width
+        height (int): Widget height
+        center_x (int): X center of the dial
+        center_y (int): Y center of the dial
+        radius (int): Radius of the dial
+        dial_rect (QRect): Area the needle, cursor and status lines stay within
+        angle_text_rect (QRect): Area of the current angle text below the dial
+        status_box_rect (QRect): Area of the numeric status box, including text
+            that runs past it
+    """
+    __slots__ = ('width', 'height', 'center_x', 'center_y', 'radius', 'dial_rect',
+                 'angle_text_rect', 'status_box_rect')
+
+    width: int
+    height: int
+    center_x: int
+    center_y: int
+    radius: int
+    dial_rect: QRect
+    angle_text_rect: QRect
+    status_box_rect: QRect
+
 
 class RotationDialWidget(QWidget):
     """Custom widget that implements the rotation dial control UI.
@@ -32,8 +172,37 @@ class RotationDialWidget(QWidget):
         _important_angles: List of important angles to highlight
     """
     
+    # Instance state is stored in slots; sip wrappers still provide an
+    # instance __dict__ alongside them
+    __slots__ = ('_angle', '_pressed', '_hover_angle', '_origin_angle', '_auto_return',
+                 '_auto_return_threshold', '_min_angle', '_max_angle', '_has_limits', '_geom',
+                 '_use_180_convention', '_show_cursor', '_important_angles', '_important_angles_labels',
+                 '_highlight_important_angles', '_show_drone_status', '_drone_status_angles',
+                 '_drone_custom_direction_label', '_drone_status_colors',
+                 '_drone_status_thickness', '_drone_altitude', '_drone_ground_speed',
+                 '_drone_vertical_speed', '_drone_battery_level', '_drone_distance_to_home',
+                 '_drone_custom_value', '_drone_custom_label', '_show_numeric_values',
+                 '_numeric_precision', '_value_font', '_bg_cache', '_bg_cache_key',
+                 '_full_cache', '_cache_dirty', '_status_box_cache', '_status_box_key',
+                 '_pending_mouse', '_emit_pending', '_coalesce_timer',
+                 '_paint_clock', '_repaint_timer', '_repaint_area')
+    
     angleChanged = pyqtSignal(float)
     
+    # New angle for each control key, from the widget and the step in degrees
+    _KEY_ACTIONS = {
+        Qt.Key_Left: lambda dial, step: (dial._angle - step) % 360,
+        Qt.Key_Right: lambda dial, step: (dial._angle + step) % 360,
+        # Move to the nearest multiple of 90 degrees
+        Qt.Key_Up: lambda dial, step: round(dial._angle / 90) * 90 % 360,
+        # Move to origin
+        Qt.Key_Down: lambda dial, step: dial._origin_angle,
+        # Return to origin
+        Qt.Key_Home: lambda dial, step: dial._origin_angle,
+        # Go to opposite of origin
+        Qt.Key_End: lambda dial, step: (dial._origin_angle + 180) % 360,
+    }
+    
     def __init__(self, parent=None):
         """Initialize the rotation dial widget."""
         super().__init__(parent)
@@ -41,6 +210,10 @@ class RotationDialWidget(QWidget):
         # Set minimum size
         self.setMinimumSize(100, 100)
         
+        # The background pixmap covers every pixel, so Qt needn't erase first
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        
         # Initialize angle (in degrees, 0-359)
         self._angle = 0.0
         self._pressed = False
@@ -52,6 +225,7 @@ class RotationDialWidget(QWidget):
         self._auto_return_threshold = 20.0  # Degrees from origin to auto-return
         self._min_angle = None  # No limits by default
         self._max_angle = None
+        self._has_limits = False  # Whether both limits are set, checked before clamping
         self._use_180_convention = False  # Use 0-359 by default
         self._show_cursor = True  # Show angle cursor
         
@@ -62,45 +236,22 @@ class RotationDialWidget(QWidget):
         
         # Drone status indicators
         self._show_drone_status = False
-        self._drone_heading = None  # Current drone heading
-        self._drone_target = None   # Target heading
-        self._drone_home = None     # Home direction
-        self._drone_wind = None     # Wind direction
-        self._drone_status_colors = {
-            'heading': QColor(0, 200, 255),    # Blue
-            'target': QColor(50, 255, 50),     # Green
-            'home': QColor(255, 150, 0),       # Orange
-            'wind': QColor(255, 50, 50)        # Red
-        }
-        self._drone_status_thickness = {
-            'heading': 3,
-            'target': 2,
-            'home': 2,
-            'wind': 2
-        }
         
-        # Additional drone status indicators
-        self._drone_velocity = None          # Current velocity vector direction
-        self._drone_acceleration = None      # Current acceleration vector direction
-        self._drone_gps_direction = None     # GPS direction to destination
-        self._drone_obstacle = None          # Direction of nearest obstacle
-        self._drone_custom_direction = None  # Custom direction indicator (configurable)
-        
-        # Additional status colors and thickness
-        self._drone_status_colors.update({
-            'velocity': QColor(100, 200, 255),     # Light blue
-            'acceleration': QColor(100, 255, 200), # Light green
-            'gps': QColor(255, 255, 100),          # Yellow
-            'obstacle': QColor(255, 100, 100),     # Light red
-            'custom': QColor(200, 100, 255)        # Purple
-        })
-        self._drone_status_thickness.update({
-            'velocity': 2,
-            'acceleration': 2,
-            'gps': 2, 
-            'obstacle': 2,
-            'custom': 2
-        })
+        # Direction of each indicator in degrees (or None), in drawing order
+        self._drone_status_angles = {
+            'heading': None,       # Current drone heading
+            'target': None,        # Target heading
+            'home': None,          # Home direction
+            'wind': None,          # Wind direction
+            'velocity': None,      # Current velocity vector direction
+            'acceleration': None,  # Current acceleration vector direction
+            'gps': None,           # GPS direction to destination
+            'obstacle': None,      # Direction of nearest obstacle
+            'custom': None         # Custom direction indicator (configurable)
+        }
+        self._drone_custom_direction_label = None  # Label for the custom direction
+        self._drone_status_colors = _DEFAULT_STATUS_COLORS
+        self._drone_status_thickness = _DEFAULT_STATUS_THICKNESS
         
         # Drone numeric status values (displayed as text)
         self._drone_altitude = None           # Current altitude in meters
@@ -115,6 +266,43 @@ class RotationDialWidget(QWidget):
         self._show_numeric_values = True      # Whether to show numeric values
         self._numeric_precision = 1           # Decimal places for numeric values
         
+        # Font for the angle text and the drone status values
+        self._value_font = QFont()
+        self._value_font.setPointSize(10)
+        
+        # Cached rendering of the static dial, rebuilt when its key changes
+        self._bg_cache = None
+        self._bg_cache_key = None
+        
+        # Rendering of the whole widget, and the area of it that is out of date
+        self._full_cache = None
+        self._cache_dirty = QRect()
+        
+        # Cached rendering of the drone status box, keyed on its text
+        self._status_box_cache = None
+        self._status_box_key = None
+        
+        # Latest drag position waiting for the coalescing timer, if any
+        self._pending_mouse = None
+        self._emit_pending = False  # Whether a drag changed the angle since the last emit
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(_DRAG_COALESCE_MS)
+        self._coalesce_timer.timeout.connect(self._flush_mouse)
+        
+        # Time since the last paint, and the timer and screen area for repaints
+        # held back to keep within _MIN_REPAINT_MS. The area is kept apart from
+        # _cache_dirty, which an unrelated partial paint may clear first.
+        self._paint_clock = QElapsedTimer()
+        self._repaint_area = QRect()
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.timeout.connect(self._repaint_dirty)
+        
+        warm_up(_clamp_wrapped, 0.0, 0.0, 0.0)
+        
+        self._recompute_geometry()
+        
         # Set focus policy to accept keyboard focus
         self.setFocusPolicy(Qt.StrongFocus)
         
@@ -132,30 +320,208 @@ class RotationDialWidget(QWidget):
     def paintEvent(self, event):
         """Draw the rotation dial widget.
         
+        The dial is rendered into a widget-sized pixmap. Only the areas
+        invalidated since the last paint are re-rendered, so repaints caused by
+        anything else (e.g. overlapping siblings) just copy the pixmap.
+        
         Args:
             event: Paint event
         """
+        # Nothing can be seen, so leave the dirty areas for the next exposure
+        if self.visibleRegion().isEmpty():
+            return
+        
+        ratio = self.devicePixelRatioF()
+        cache_size = QSize(ceil(self.width() * ratio), ceil(self.height() * ratio))
+        cache = self._full_cache
+        if cache is None or cache.size() != cache_size or cache.devicePixelRatio() != ratio:
+            cache = QPixmap(cache_size)
+            cache.setDevicePixelRatio(ratio)
+            self._full_cache = cache
+            self._cache_dirty = self.rect()
+        
+        dirty = self._cache_dirty
+        if not dirty.isEmpty():
+            self._cache_dirty = QRect()
+            painter = QPainter(cache)
+            painter.setClipRect(dirty)
+            self._paint_dial(painter, dirty)
+            painter.end()
+        
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, cache)
+        self._paint_clock.start()
+    
+    def _paint_dial(self, painter, dirty, _sin=math.sin, _cos=math.cos, _radians=math.radians):
+        """Draw the dial, skipping the parts outside the dirty area.
+        
+        Args:
+            painter: Painter to draw with
+            dirty: Area being re-rendered
+        """
+        g = self._geom
+        center_x = g.center_x
+        center_y = g.center_y
+        radius = g.radius
+        
+        # The static dial only depends on these, so it is cached in a pixmap
+        key = (g.width, g.height, self._origin_angle, self._min_angle, self._max_angle,
+               self._use_180_convention)
+        if key != self._bg_cache_key:
+            self._rebuild_background(key, center_x, center_y, radius)
+        
+        # Only draw the parts that overlap the area being repainted
+        in_dial = dirty.intersects(g.dial_rect)
+        
         painter.setRenderHint(QPainter.Antialiasing)
+        painter.drawPixmap(0, 0, self._bg_cache)
         
-        # Calculate the dimensions
-        width = self.width()
-        height = self.height()
-        size = min(width, height)
-        center_x = width // 2
-        center_y = height // 2
-        radius = size // 2 - 10  # Smaller than the widget to allow for padding
+        painter.setFont(self._value_font)
         
+        if in_dial:
+            # The needle and the cursor share the direction of the current angle
+            angle_rad = _radians(self._angle)
+            angle_sin = _sin(angle_rad)
+            angle_cos = _cos(angle_rad)
+            
+            # Draw the current angle indicator (needle)
+            needle_x = center_x + int(radius * 0.8 * angle_sin)
+            needle_y = center_y - int(radius * 0.8 * angle_cos)
+            
+            painter.setPen(_PEN_NEEDLE)
+            painter.drawLine(center_x, center_y, needle_x, needle_y)
+            
+            # Draw indicator dot at the end of the needle
+            painter.setBrush(_BRUSH_NEEDLE)
+            painter.drawEllipse(QPoint(needle_x, needle_y), 5, 5)
+            
+            # Draw center dot
+            painter.setBrush(_BRUSH_CENTER)
+            painter.drawEllipse(QPoint(center_x, center_y), 3, 3)
+        
+        # Draw current angle text
+        if dirty.intersects(g.angle_text_rect):
+            painter.setPen(_PEN_TEXT)
+            
+            # Display the angle with 1 decimal place, adjusted for origin and convention
+            display_angle = (self._angle - self._origin_angle) % 360
+            if self._use_180_convention and display_angle > 180:
+                display_angle = display_angle - 360
+                
+            angle_text = f"{display_angle:.1f}°"
+            painter.drawText(center_x - 20, center_y + radius + 25, angle_text)
+        
+        # Draw cursor indicating current angle position if enabled
+        if in_dial and self._show_cursor and not self._pressed:
+            cursor_inner = radius + 5
+            cursor_outer = radius + 12
+            
+            cursor_x1 = center_x + int(cursor_inner * angle_sin)
+            cursor_y1 = center_y - int(cursor_inner * angle_cos)
+            cursor_x2 = center_x + int(cursor_outer * angle_sin)
+            cursor_y2 = center_y - int(cursor_outer * angle_cos)
+            
+            painter.setPen(_PEN_CURSOR)
+            painter.drawLine(cursor_x1, cursor_y1, cursor_x2, cursor_y2)
+        
+        # Draw drone status indicators if enabled
+        if in_dial and self._show_drone_status:
+            colors = self._drone_status_colors
+            thicknesses = self._drone_status_thickness
+            for name, angle in self._drone_status_angles.items():
+                if angle is None:
+                    continue
+                
+                status_rad = _radians(angle)
+                status_x = center_x + int(radius * 0.9 * _sin(status_rad))
+                status_y = center_y - int(radius * 0.9 * _cos(status_rad))
+                
+                color = colors[name]
+                painter.setPen(QPen(color, thicknesses[name]))
+                painter.drawLine(center_x, center_y, status_x, status_y)
+                
+                # Draw indicator at the end of the line
+                painter.setBrush(QBrush(color))
+                painter.drawEllipse(QPoint(status_x, status_y), 3, 3)
+            
+        # Draw numeric status values if enabled
+        if (self._show_drone_status and self._show_numeric_values
+                and dirty.intersects(g.status_box_rect)):
+            status_values = []
+            
+            # Format precision for all numeric values
+            spec = f".{self._numeric_precision}f"
+            
+            # Add each value with its label, if available
+            if self._drone_altitude is not None:
+                status_values.append(f"Alt: {format(self._drone_altitude, spec)}m")
+            
+            if self._drone_ground_speed is not None:
+                status_values.append(f"GS: {format(self._drone_ground_speed, spec)}m/s")
+            
+            if self._drone_vertical_speed is not None:
+                status_values.append(f"VS: {format(self._drone_vertical_speed, spec)}m/s")
+            
+            if self._drone_battery_level is not None:
+                status_values.append(f"Bat: {format(self._drone_battery_level, spec)}%")
+            
+            if self._drone_distance_to_home is not None:
+                status_values.append(f"Home: {format(self._drone_distance_to_home, spec)}m")
+            
+            if self._drone_custom_value is not None:
+                status_values.append(f"{self._drone_custom_label}: {format(self._drone_custom_value, spec)}")
+            
+            # Draw status box if we have values to show, from a pixmap that is
+            # only re-rendered when the text changes
+            if status_values:
+                key = (tuple(status_values), self.devicePixelRatioF())
+                if key != self._status_box_key:
+                    self._rebuild_status_box(key)
+                painter.drawPixmap(g.status_box_rect.topLeft(), self._status_box_cache)
+        
+    def _rebuild_background(self, key, center_x, center_y, radius):
+        """Render the static parts of the dial into the background pixmap.
+        
+        Args:
+            key: Cache key the pixmap is rendered for
+            center_x: X coordinate of the dial center
+            center_y: Y coordinate of the dial center
+            radius: Radius of the dial
+        """
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(ceil(self.width() * ratio), ceil(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        # Opaque fill in place of the erase skipped by WA_OpaquePaintEvent
+        pixmap.fill(self.palette().color(self.backgroundRole()))
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        # A widget painter picks up the widget font, a pixmap painter does not
+        painter.setFont(self.font())
+        self._paint_background(painter, center_x, center_y, radius)
+        painter.end()
+        
+        self._bg_cache = pixmap
+        self._bg_cache_key = key
+    
+    def _paint_background(self, painter, center_x, center_y, radius):
+        """Draw the outer circle, degree markers and min/max markers.
+        
+        Args:
+            painter: Painter to draw with
+            center_x: X coordinate of the dial center
+            center_y: Y coordinate of the dial center
+            radius: Radius of the dial
+        """
         # Draw the outer circle
-        painter.setPen(QPen(QColor(100, 100, 100), 2))
-        painter.setBrush(QBrush(QColor(50, 50, 50)))
+        painter.setPen(_PEN_OUTER)
+        painter.setBrush(_BRUSH_OUTER)
         
         outer_rect = QRect(center_x - radius, center_y - radius, radius * 2, radius * 2)
         painter.drawEllipse(outer_rect)
         
         # Draw orientation indicator line (shows current zero orientation)
-        orientation_line_color = QColor(50, 200, 50, 100)
-        painter.setPen(QPen(orientation_line_color, 1, Qt.DashLine))
+        painter.setPen(_PEN_ORIGIN_LINE)
         
         # Draw a line from center to the edge in the direction of the origin
         origin_rad = math.radians(self._origin_angle)
@@ -163,15 +529,16 @@ class RotationDialWidget(QWidget):
         origin_y = center_y - int(radius * 1.1 * math.cos(origin_rad))
         painter.drawLine(center_x, center_y, origin_x, origin_y)
         
-        # Draw degree markers
-        painter.setPen(QPen(QColor(120, 120, 120), 1))
-        for i in range(0, 360, 15):
-            angle_rad = math.radians(i)
-            
+        # Collect the degree markers and labels so each pen is set only once
+        tick_lines = []
+        origin_lines = []
+        labels = []
+        origin_offset = int(self._origin_angle) % 90
+        for i, sin_i, cos_i in zip(_TICK_ANGLES, _TICK_SIN, _TICK_COS):
             # Calculate marker size based on whether it's a major or minor tick
             # and whether it aligns with the current orientation
             is_major = i % 90 == 0
-            is_origin_aligned = (i % 90) == (int(self._origin_angle) % 90)
+            is_origin_aligned = (i % 90) == origin_offset
             
             # Make ticks that align with the current orientation more prominent
             tick_length = 5
@@ -182,45 +549,27 @@ class RotationDialWidget(QWidget):
                 
             # Start position for the line
             inner_radius = radius - tick_length
-            x1 = center_x + int(inner_radius * math.sin(angle_rad))
-            y1 = center_y - int(inner_radius * math.cos(angle_rad))
+            x1 = center_x + int(inner_radius * sin_i)
+            y1 = center_y - int(inner_radius * cos_i)
             
             # End position for the line
-            x2 = center_x + int(radius * math.sin(angle_rad))
-            y2 = center_y - int(radius * math.cos(angle_rad))
+            x2 = center_x + int(radius * sin_i)
+            y2 = center_y - int(radius * cos_i)
             
             # Use different colors for ticks aligned with origin
             if is_origin_aligned and not is_major:
-                painter.setPen(QPen(QColor(50, 180, 50), 1))
+                origin_lines.append(QLine(x1, y1, x2, y2))
             else:
-                painter.setPen(QPen(QColor(120, 120, 120), 1))
-                
-            painter.drawLine(x1, y1, x2, y2)
+                tick_lines.append(QLine(x1, y1, x2, y2))
             
-            # Draw degree numbers for major angles, adjusted for origin orientation
-            if i % 90 == 0:
+            # Lay out the degree numbers for major angles
+            if is_major:
                 text_radius = inner_radius - 15
                 
-                # Calculate text position with offset for better positioning
-                text_width = 20  # Approximate width of the text
-                text_height = 10  # Approximate height of the text
-                
-                # Adjust text position based on which quadrant it's in
-                if i == 0:  # Top
-                    x_offset = -text_width / 2
-                    y_offset = -5
-                elif i == 90:  # Right
-                    x_offset = 5
-                    y_offset = text_height / 2 - 5
-                elif i == 180:  # Bottom
-                    x_offset = -text_width / 2
-                    y_offset = text_height + 5
-                else:  # Left (270)
-                    x_offset = -text_width - 5
-                    y_offset = text_height / 2 - 5
-                
-                x_text = center_x + int(text_radius * math.sin(angle_rad)) + x_offset
-                y_text = center_y - int(text_radius * math.cos(angle_rad)) + y_offset
+                # Offset the text based on which quadrant it's in
+                x_offset, y_offset = _MAJOR_LABEL_OFFSETS[i]
+                x_text = center_x + int(text_radius * sin_i) + x_offset
+                y_text = center_y - int(text_radius * cos_i) + y_offset
                 
                 # Calculate display angle based on origin and convention
                 display_angle = (i - self._origin_angle) % 360
@@ -228,19 +577,31 @@ class RotationDialWidget(QWidget):
                     display_angle = display_angle - 360
                 
                 # For major angles, show the display angle
-                display_text = f"{int(display_angle)}°"
-                
-                painter.setPen(QColor(200, 200, 200))
-                painter.drawText(int(x_text), int(y_text), display_text)
+                labels.append((x_text, y_text, f"{int(display_angle)}°"))
+        
+        # Draw degree markers
+        painter.setPen(_PEN_TICK)
+        painter.drawLines(tick_lines)
+        if origin_lines:
+            painter.setPen(_PEN_TICK_ORIGIN)
+            painter.drawLines(origin_lines)
+        
+        # Draw degree numbers for major angles, adjusted for origin orientation
+        painter.setPen(_PEN_TEXT)
+        for x_text, y_text, display_text in labels:
+            painter.drawText(x_text, y_text, display_text)
                 
+        # The limit markers are axis-aligned squares, which antialiasing only blurs
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        
         # Draw min/max angle limits if set
         if self._min_angle is not None:
             min_rad = math.radians(self._min_angle)
             min_x = center_x + int(radius * 0.9 * math.sin(min_rad))
             min_y = center_y - int(radius * 0.9 * math.cos(min_rad))
             
-            painter.setPen(QPen(QColor(200, 100, 50), 2))
-            painter.setBrush(QBrush(QColor(200, 100, 50)))
+            painter.setPen(_PEN_LIMIT)
+            painter.setBrush(_BRUSH_LIMIT)
             painter.drawRect(min_x - 3, min_y - 3, 6, 6)
             
             # Draw min label
@@ -253,7 +614,7 @@ class RotationDialWidget(QWidget):
             if self._use_180_convention and min_display > 180:
                 min_display = min_display - 360
                 
-            painter.setPen(QColor(200, 100, 50))
+            painter.setPen(_PEN_LIMIT_TEXT)
             painter.drawText(min_label_x, min_label_y, f"min")
         
         if self._max_angle is not None:
@@ -261,8 +622,8 @@ class RotationDialWidget(QWidget):
             max_x = center_x + int(radius * 0.9 * math.sin(max_rad))
             max_y = center_y - int(radius * 0.9 * math.cos(max_rad))
             
-            painter.setPen(QPen(QColor(200, 100, 50), 2))
-            painter.setBrush(QBrush(QColor(200, 100, 50)))
+            painter.setPen(_PEN_LIMIT)
+            painter.setBrush(_BRUSH_LIMIT)
             painter.drawRect(max_x - 3, max_y - 3, 6, 6)
             
             # Draw max label
@@ -275,129 +636,163 @@ class RotationDialWidget(QWidget):
             if self._use_180_convention and max_display > 180:
                 max_display = max_display - 360
                 
-            painter.setPen(QColor(200, 100, 50))
+            painter.setPen(_PEN_LIMIT_TEXT)
             painter.drawText(max_label_x, max_label_y, f"max")
+    
+    def _rebuild_status_box(self, key):
+        """Render the drone status box into its cached pixmap.
         
-        # Draw the current angle indicator (needle)
-        angle_rad = math.radians(self._angle)
-        needle_x = center_x + int(radius * 0.8 * math.sin(angle_rad))
-        needle_y = center_y - int(radius * 0.8 * math.cos(angle_rad))
+        Args:
+            key: Cache key, the status value strings and device pixel ratio
+        """
+        status_values, ratio = key
+        
+        # Create background for status values
+        status_box_height = len(status_values) * 15 + 10
+        status_box_width = 120
+        
+        # Leave room for the antialiased border and for values running past
+        # the box up to the widget edge
+        pixmap = QPixmap(ceil((status_box_width + 11) * ratio),
+                         ceil((status_box_height + 2) * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        status_box_x = 1
+        status_box_y = 1
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self._value_font)
+        
+        # Draw semi-transparent background
+        painter.setBrush(_BRUSH_STATUS_BOX)
+        painter.setPen(_PEN_STATUS_BOX)
+        painter.drawRoundedRect(status_box_x, status_box_y, status_box_width, status_box_height, 5, 5)
+        
+        # Draw status values
+        painter.setPen(_PEN_STATUS_TEXT)
+        for i, value in enumerate(status_values):
+            y_pos = status_box_y + 20 + (i * 15)
+            painter.drawText(status_box_x + 10, y_pos, value)
+            
+        # Draw "Drone Status" header
+        painter.setPen(_PEN_STATUS_HEADER)
+        painter.drawText(status_box_x + 10, status_box_y + 15, "Drone Status")
+        painter.end()
         
-        painter.setPen(QPen(QColor(200, 50, 50), 2))
-        painter.drawLine(center_x, center_y, needle_x, needle_y)
+        self._status_box_cache = pixmap
+        self._status_box_key = key
+    
+    def resizeEvent(self, event):
+        """Recompute the geometry and drop the cached background on resize.
         
-        # Draw indicator dot at the end of the needle
-        painter.setBrush(QBrush(QColor(200, 50, 50)))
-        painter.drawEllipse(QPoint(needle_x, needle_y), 5, 5)
+        Args:
+            event: Resize event
+        """
+        self._recompute_geometry()
+        self._bg_cache_key = None
+        super().resizeEvent(event)
+    
+    def _recompute_geometry(self):
+        """Recompute the geometry that depends on the widget size."""
+        width = self.width()
+        height = self.height()
+        size = min(width, height)
+        center_x = width // 2
+        center_y = height // 2
+        radius = size // 2 - 10  # Smaller than the widget to allow for padding
         
-        # Draw center dot
-        painter.setBrush(QBrush(QColor(150, 150, 150)))
-        painter.drawEllipse(QPoint(center_x, center_y), 3, 3)
+        self._geom = _DialGeometry(
+            width=width,
+            height=height,
+            center_x=center_x,
+            center_y=center_y,
+            radius=radius,
+            # The cursor, the furthest out, reaches radius + 12 plus its pen
+            dial_rect=QRect(center_x - radius - 14, center_y - radius - 14,
+                            radius * 2 + 28, radius * 2 + 28),
+            angle_text_rect=QRect(center_x - 25, center_y + radius + 10, 80, 20),
+            # The box is at most 6 rows tall, and long values may run past it
+            # up to the widget edge
+            status_box_rect=QRect(width - 131, 9, 131, 102)
+        )
+    
+    def changeEvent(self, event):
+        """Re-render the dial when the font or palette changes.
         
-        # Draw current angle text
-        painter.setPen(QColor(200, 200, 200))
-        font = QFont()
-        font.setPointSize(10)
-        painter.setFont(font)
+        Args:
+            event: Change event
+        """
+        # The labels use the widget font and the fill comes from the palette
+        if event.type() in (QEvent.FontChange, QEvent.PaletteChange):
+            self._bg_cache_key = None
+            self._cache_dirty = self.rect()
+        super().changeEvent(event)
+    
+    def _needle_dirty_rect(self, angle):
+        """Get the area repainted when the needle moves to or from an angle.
         
-        # Display the angle with 1 decimal place, adjusted for origin and convention
-        display_angle = (self._angle - self._origin_angle) % 360
-        if self._use_180_convention and display_angle > 180:
-            display_angle = display_angle - 360
+        Args:
+            angle: Needle angle in degrees
             
-        angle_text = f"{display_angle:.1f}°"
-        painter.drawText(center_x - 20, center_y + radius + 25, angle_text)
+        Returns:
+            The rectangle covering the needle, its cursor and the angle text
+        """
+        g = self._geom
+        center_x = g.center_x
+        center_y = g.center_y
+        radius = g.radius
+        
+        # The cursor reaches furthest out, to radius + 12
+        angle_rad = math.radians(angle)
+        tip_x = center_x + int((radius + 12) * math.sin(angle_rad))
+        tip_y = center_y - int((radius + 12) * math.cos(angle_rad))
+        
+        # Pad for the needle dot and pen widths
+        rect = QRect(QPoint(center_x, center_y), QPoint(tip_x, tip_y)).normalized()
+        rect = rect.adjusted(-7, -7, 7, 7)
+        return rect.united(g.angle_text_rect)
+    
+    def _invalidate(self, rect=None):
+        """Mark part of the dial for re-rendering and schedule its repaint.
         
-        # Draw cursor indicating current angle position if enabled
-        if self._show_cursor and not self._pressed:
-            cursor_rad = math.radians(self._angle)
-            cursor_inner = radius + 5
-            cursor_outer = radius + 12
-            
-            cursor_x1 = center_x + int(cursor_inner * math.sin(cursor_rad))
-            cursor_y1 = center_y - int(cursor_inner * math.cos(cursor_rad))
-            cursor_x2 = center_x + int(cursor_outer * math.sin(cursor_rad))
-            cursor_y2 = center_y - int(cursor_outer * math.cos(cursor_rad))
-            
-            painter.setPen(QPen(QColor(220, 220, 100), 2))
-            painter.drawLine(cursor_x1, cursor_y1, cursor_x2, cursor_y2)
+        Args:
+            rect: Area that changed, or None for the whole widget
+        """
+        if rect is None:
+            rect = self.rect()
+        dirty = self._cache_dirty
+        area = self._repaint_area
+        # Already waiting for a repaint, e.g. from an earlier setter in the
+        # same event loop turn
+        if dirty.contains(rect) and area.contains(rect):
+            return
+        self._cache_dirty = dirty.united(rect)
+        self._repaint_area = area.united(rect)
+        
+        if not self._pressed and self._paint_clock.isValid():
+            elapsed = self._paint_clock.elapsed()
+            if elapsed < _MIN_REPAINT_MS:
+                if not self._repaint_timer.isActive():
+                    self._repaint_timer.start(_MIN_REPAINT_MS - elapsed)
+                return
+        self._repaint_dirty()
+    
+    def _repaint_dirty(self):
+        """Schedule a repaint of every area invalidated since the last one."""
+        # Held back areas are included, so the timer is no longer needed
+        self._repaint_timer.stop()
+        self.update(self._repaint_area)
+        self._repaint_area = QRect()
+    
+    def _update_needle(self, old_angle):
+        """Schedule a repaint of the needle at its old and current angle.
         
-        # Draw drone status indicators if enabled
-        if self._show_drone_status:
-            # Helper function to draw a status line
-            def draw_status_line(angle, color, thickness):
-                if angle is not None:
-                    status_rad = math.radians(angle)
-                    status_x = center_x + int(radius * 0.9 * math.sin(status_rad))
-                    status_y = center_y - int(radius * 0.9 * math.cos(status_rad))
-                    
-                    painter.setPen(QPen(color, thickness))
-                    painter.drawLine(center_x, center_y, status_x, status_y)
-                    
-                    # Draw indicator at the end of the line
-                    painter.setBrush(QBrush(color))
-                    painter.drawEllipse(QPoint(status_x, status_y), 3, 3)
-            
-            # Draw each status indicator
-            draw_status_line(self._drone_heading, self._drone_status_colors['heading'], self._drone_status_thickness['heading'])
-            draw_status_line(self._drone_target, self._drone_status_colors['target'], self._drone_status_thickness['target'])
-            draw_status_line(self._drone_home, self._drone_status_colors['home'], self._drone_status_thickness['home'])
-            draw_status_line(self._drone_wind, self._drone_status_colors['wind'], self._drone_status_thickness['wind'])
-            draw_status_line(self._drone_velocity, self._drone_status_colors['velocity'], self._drone_status_thickness['velocity'])
-            draw_status_line(self._drone_acceleration, self._drone_status_colors['acceleration'], self._drone_status_thickness['acceleration'])
-            draw_status_line(self._drone_gps_direction, self._drone_status_colors['gps'], self._drone_status_thickness['gps'])
-            draw_status_line(self._drone_obstacle, self._drone_status_colors['obstacle'], self._drone_status_thickness['obstacle'])
-            draw_status_line(self._drone_custom_direction, self._drone_status_colors['custom'], self._drone_status_thickness['custom'])
-            
-            # Draw numeric status values if enabled
-            if self._show_numeric_values:
-                status_values = []
-                
-                # Format precision for all numeric values
-                format_str = f"{{:.{self._numeric_precision}f}}"
-                
-                # Add each value with its label, if available
-                if self._drone_altitude is not None:
-                    status_values.append(f"Alt: {format_str.format(self._drone_altitude)}m")
-                
-                if self._drone_ground_speed is not None:
-                    status_values.append(f"GS: {format_str.format(self._drone_ground_speed)}m/s")
-                
-                if self._drone_vertical_speed is not None:
-                    status_values.append(f"VS: {format_str.format(self._drone_vertical_speed)}m/s")
-                
-                if self._drone_battery_level is not None:
-                    status_values.append(f"Bat: {format_str.format(self._drone_battery_level)}%")
-                
-                if self._drone_distance_to_home is not None:
-                    status_values.append(f"Home: {format_str.format(self._drone_distance_to_home)}m")
-                
-                if self._drone_custom_value is not None:
-                    status_values.append(f"{self._drone_custom_label}: {format_str.format(self._drone_custom_value)}")
-                
-                # Draw status box if we have values to show
-                if status_values:
-                    # Create background for status values
-                    status_box_height = len(status_values) * 15 + 10
-                    status_box_width = 120
-                    
-                    status_box_x = width - status_box_width - 10
-                    status_box_y = 10
-                    
-                    # Draw semi-transparent background
-                    painter.setBrush(QBrush(QColor(30, 30, 30, 180)))
-                    painter.setPen(QPen(QColor(100, 100, 100), 1))
-                    painter.drawRoundedRect(status_box_x, status_box_y, status_box_width, status_box_height, 5, 5)
-                    
-                    # Draw status values
-                    painter.setPen(QPen(QColor(220, 220, 220), 1))
-                    for i, value in enumerate(status_values):
-                        y_pos = status_box_y + 20 + (i * 15)
-                        painter.drawText(status_box_x + 10, y_pos, value)
-                        
-                    # Draw "Drone Status" header
-                    painter.setPen(QPen(QColor(150, 200, 255), 1))
-                    painter.drawText(status_box_x + 10, status_box_y + 15, "Drone Status")
+        Args:
+            old_angle: Needle angle before the change, in degrees
+        """
+        self._invalidate(self._needle_dirty_rect(old_angle).united(
+            self._needle_dirty_rect(self._angle)))
         
     def mousePressEvent(self, event):
         """Handle mouse press events.
@@ -407,7 +802,12 @@ class RotationDialWidget(QWidget):
         """
         if event.button() == Qt.LeftButton:
             self._pressed = True
+            # The cursor is hidden while dragging
+            if self._show_cursor:
+                self._update_needle(self._angle)
             self._update_angle(event.x(), event.y())
+            # The press is emitted with the first drag frame, or on release
+            self._coalesce_timer.start()
             self.setFocus()
     
     def mouseMoveEvent(self, event):
@@ -417,20 +817,19 @@ class RotationDialWidget(QWidget):
             event: Mouse event
         """
         if self._pressed:
-            self._update_angle(event.x(), event.y())
-        else:
+            # Only the latest position matters, so wait for the timer to apply it
+            self._pending_mouse = (event.x(), event.y())
+            if not self._coalesce_timer.isActive():
+                self._coalesce_timer.start()
+        elif self.isVisible():
             # Calculate hover angle for visual feedback
-            width = self.width()
-            height = self.height()
-            center_x = width // 2
-            center_y = height // 2
-            
-            dx = event.x() - center_x
-            dy = center_y - event.y()
+            g = self._geom
+            dx = event.x() - g.center_x
+            dy = g.center_y - event.y()
             
+            # The hover angle is not drawn, so there is nothing to repaint
             if dx != 0 or dy != 0:  # Avoid division by zero
                 self._hover_angle = math.degrees(math.atan2(dx, dy)) % 360
-                self.update()
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release events.
@@ -439,12 +838,27 @@ class RotationDialWidget(QWidget):
             event: Mouse event
         """
         if event.button() == Qt.LeftButton:
+            # Apply the last drag position before the drag ends
+            self._coalesce_timer.stop()
+            self._flush_mouse()
             self._pressed = False
+            if self._show_cursor:
+                self._update_needle(self._angle)
             
             # Check if we should auto-return to origin
             if self._auto_return:
                 self.set_angle(self._origin_angle)  # Return to origin immediately when released
     
+    def _flush_mouse(self):
+        """Apply the pending drag position, if any, and emit the new angle once."""
+        pending = self._pending_mouse
+        if pending is not None:
+            self._pending_mouse = None
+            self._update_angle(*pending)
+        if self._emit_pending:
+            self._emit_pending = False
+            self.angleChanged.emit(self._angle)
+    
     def leaveEvent(self, event):
         """Handle mouse leave events.
         
@@ -452,7 +866,6 @@ class RotationDialWidget(QWidget):
             event: Leave event
         """
         self._hover_angle = None
-        self.update()
     
     def keyPressEvent(self, event):
         """Handle keyboard events for rotation control.
@@ -462,114 +875,57 @@ class RotationDialWidget(QWidget):
         Args:
             event: Key event
         """
-        step = 1.0  # Degrees to rotate per key press
-        big_step = 15.0  # Larger step for Shift+arrow keys
-        
-        new_angle = self._angle
-        
-        if event.modifiers() & Qt.ShiftModifier:
-            step = big_step
-            
-        if event.key() == Qt.Key_Left:
-            new_angle = (self._angle - step) % 360
-        elif event.key() == Qt.Key_Right:
-            new_angle = (self._angle + step) % 360
-        elif event.key() == Qt.Key_Up:
-            # Move to the nearest multiple of 90 degrees
-            new_angle = round(self._angle / 90) * 90 % 360
-        elif event.key() == Qt.Key_Down:
-            # Move to origin
-            new_angle = self._origin_angle
-        elif event.key() == Qt.Key_Home:
-            # Return to origin
-            new_angle = self._origin_angle
-        elif event.key() == Qt.Key_End:
-            # Go to opposite of origin
-            new_angle = (self._origin_angle + 180) % 360
-        else:
+        action = self._KEY_ACTIONS.get(event.key())
+        if action is None:
             super().keyPressEvent(event)
             return
-            
+        
+        # Degrees to rotate per key press, with a larger step for Shift+arrow keys
+        step = 15.0 if event.modifiers() & Qt.ShiftModifier else 1.0
+        new_angle = action(self, step)
+        
         # Apply angle limits if set
-        if self._min_angle is not None and self._max_angle is not None:
-            # Handle wrapping cases for min/max angles
-            min_angle = self._min_angle % 360
-            max_angle = self._max_angle % 360
-            
-            if min_angle < max_angle:
-                # Normal case: min is less than max
-                if new_angle < min_angle or new_angle > max_angle:
-                    # Clamp to nearest limit
-                    if abs(new_angle - min_angle) < abs(new_angle - max_angle):
-                        new_angle = min_angle
-                    else:
-                        new_angle = max_angle
-            else:
-                # Wrapped case: min is greater than max (e.g. min=330, max=30)
-                if new_angle > max_angle and new_angle < min_angle:
-                    # Clamp to nearest limit
-                    if abs(new_angle - min_angle) < abs(new_angle - max_angle):
-                        new_angle = min_angle
-                    else:
-                        new_angle = max_angle
+        if self._has_limits:
+            new_angle = self._clamp(new_angle)
         
         # Update angle if it changed
         if new_angle != self._angle:
+            old_angle = self._angle
             self._angle = new_angle
-            self.update()
+            self._update_needle(old_angle)
             self.angleChanged.emit(new_angle)
     
     def _update_angle(self, mouse_x, mouse_y):
         """Update rotation angle based on mouse coordinates.
         
+        The change is emitted by _flush_mouse, once per drag frame.
+        
         Args:
             mouse_x: Mouse X position
             mouse_y: Mouse Y position
         """
-        # Calculate center
-        width = self.width()
-        height = self.height()
-        center_x = width // 2
-        center_y = height // 2
-        
         # Calculate the angle from center to mouse position
-        dx = mouse_x - center_x
-        dy = center_y - mouse_y  # Invert Y for logical coordinates
+        g = self._geom
+        dx = mouse_x - g.center_x
+        dy = g.center_y - mouse_y  # Invert Y for logical coordinates
         
         if dx == 0 and dy == 0:
             return  # Avoid division by zero
             
         # Calculate angle in degrees (0 at top, clockwise)
-        angle = math.degrees(math.atan2(dx, dy)) % 360
+        angle = math.degrees(math.atan2(dx, dy))
+        angle = round(angle * _ANGLE_RESOLUTION) / _ANGLE_RESOLUTION % 360
         
         # Apply angle limits if set
-        if self._min_angle is not None and self._max_angle is not None:
-            # Handle wrapping cases for min/max angles
-            min_angle = self._min_angle % 360
-            max_angle = self._max_angle % 360
-            
-            if min_angle < max_angle:
-                # Normal case: min is less than max
-                if angle < min_angle or angle > max_angle:
-                    # Clamp to nearest limit
-                    if abs(angle - min_angle) < abs(angle - max_angle):
-                        angle = min_angle
-                    else:
-                        angle = max_angle
-            else:
-                # Wrapped case: min is greater than max (e.g. min=330, max=30)
-                if angle > max_angle and angle < min_angle:
-                    # Clamp to nearest limit
-                    if abs(angle - min_angle) < abs(angle - max_angle):
-                        angle = min_angle
-                    else:
-                        angle = max_angle
+        if self._has_limits:
+            angle = self._clamp(angle)
         
         # Update angle if changed
         if angle != self._angle:
+            old_angle = self._angle
             self._angle = angle
-            self.update()
-            self.angleChanged.emit(angle)
+            self._update_needle(old_angle)
+            self._emit_pending = True
     
     def set_angle(self, angle):
         """Set the rotation angle programmatically.
@@ -581,34 +937,27 @@ class RotationDialWidget(QWidget):
         angle = angle % 360
         
         # Apply angle limits if set
-        if self._min_angle is not None and self._max_angle is not None:
-            # Handle wrapping cases for min/max angles
-            min_angle = self._min_angle % 360
-            max_angle = self._max_angle % 360
-            
-            if min_angle < max_angle:
-                # Normal case: min is less than max
-                if angle < min_angle or angle > max_angle:
-                    # Clamp to nearest limit
-                    if abs(angle - min_angle) < abs(angle - max_angle):
-                        angle = min_angle
-                    else:
-                        angle = max_angle
-            else:
-                # Wrapped case: min is greater than max (e.g. min=330, max=30)
-                if angle > max_angle and angle < min_angle:
-                    # Clamp to nearest limit
-                    if abs(angle - min_angle) < abs(angle - max_angle):
-                        angle = min_angle
-                    else:
-                        angle = max_angle
+        if self._has_limits:
+            angle = self._clamp(angle)
         
         # Update if changed
         if angle != self._angle:
+            old_angle = self._angle
             self._angle = angle
-            self.update()
+            self._update_needle(old_angle)
             self.angleChanged.emit(angle)
     
+    def _clamp(self, angle):
+        """Apply the angle limits; callers check _has_limits first.
+        
+        Args:
+            angle: Angle in degrees (0-359)
+            
+        Returns:
+            The angle, or the nearest limit if it is outside the allowed range
+        """
+        return _clamp_wrapped(angle, self._min_angle, self._max_angle)
+    
     def get_angle(self):
         """Get the current rotation angle.
         
@@ -652,7 +1001,8 @@ class RotationDialWidget(QWidget):
             # Use the provided angle value
             self._origin_angle = angle % 360
             
-        self.update()
+        self._bg_cache_key = None
+        self._invalidate()
     
     def set_auto_return(self, enabled, threshold=None):
         """Set auto-return to origin behavior.
@@ -674,9 +1024,12 @@ class RotationDialWidget(QWidget):
         """
         self._min_angle = min_angle
         self._max_angle = max_angle
+        self._has_limits = min_angle is not None and max_angle is not None
+        self._bg_cache_key = None
+        self._invalidate()
         
         # If current angle is outside limits, adjust it
-        if min_angle is not None and max_angle is not None:
+        if self._has_limits:
             self.set_angle(self._angle)  # This will apply the limits
     
     def set_angle_convention(self, use_180_convention):
@@ -686,7 +1039,8 @@ class RotationDialWidget(QWidget):
             use_180_convention: If True, use -180 to 180 range. If False, use 0 to 359.
         """
         self._use_180_convention = use_180_convention
-        self.update()
+        self._bg_cache_key = None
+        self._invalidate()
     
     def set_cursor_visible(self, visible):
         """Set whether to show the angle cursor.
@@ -694,8 +1048,10 @@ class RotationDialWidget(QWidget):
         Args:
             visible: Whether to show the cursor
         """
+        if visible == self._show_cursor:
+            return
         self._show_cursor = visible
-        self.update()
+        self._invalidate()
         
     def set_important_angles(self, angles, labels=None):
         """Set important angles to highlight on the dial.
@@ -711,7 +1067,7 @@ class RotationDialWidget(QWidget):
         else:
             self._important_angles_labels = {}
             
-        self.update()
+        self._invalidate()
         
     def set_highlight_important_angles(self, highlight):
         """Set whether to highlight important angles.
@@ -719,8 +1075,10 @@ class RotationDialWidget(QWidget):
         Args:
             highlight: Whether to show special indicators for important angles
         """
+        if highlight == self._highlight_important_angles:
+            return
         self._highlight_important_angles = highlight
-        self.update()
+        self._invalidate()
         
     def get_important_angles(self):
         """Get the list of important angles.
@@ -736,20 +1094,54 @@ class RotationDialWidget(QWidget):
         Args:
             show: Whether to show drone status indicators
         """
+        if show == self._show_drone_status:
+            return
         self._show_drone_status = show
-        self.update()
+        self._invalidate()
         
+    def _set_drone_status_angle(self, name, angle):
+        """Store the direction of a drone status indicator.
+        
+        Args:
+            name: Indicator name, a key of _drone_status_angles
+            angle: Direction in degrees or None to hide the indicator
+            
+        Returns:
+            True if the direction changed
+        """
+        if angle is not None:
+            angle = angle % 360
+        if angle == self._drone_status_angles[name]:
+            return False
+        self._drone_status_angles[name] = angle
+        return True
+    
+    def _value_text_changed(self, old, new):
+        """Check whether a numeric status value would be displayed differently.
+        
+        Telemetry often repeats a value or changes it below the display
+        precision, which needn't repaint the status box.
+        
+        Args:
+            old: Previous value or None
+            new: New value or None
+            
+        Returns:
+            True if the formatted text of the two values differs
+        """
+        if old is None or new is None:
+            return old is not new
+        spec = f".{self._numeric_precision}f"
+        return format(old, spec) != format(new, spec)
+    
     def set_drone_heading(self, heading):
         """Set the current drone heading.
         
         Args:
             heading: Current heading in degrees or None
         """
-        if heading is not None:
-            self._drone_heading = heading % 360
-        else:
-            self._drone_heading = None
-        self.update()
+        if self._set_drone_status_angle('heading', heading):
+            self._invalidate(self._geom.dial_rect)
         
     def set_drone_target(self, target):
         """Set the target heading.
@@ -757,11 +1149,8 @@ class RotationDialWidget(QWidget):
         Args:
             target: Target heading in degrees or None
         """
-        if target is not None:
-            self._drone_target = target % 360
-        else:
-            self._drone_target = None
-        self.update()
+        if self._set_drone_status_angle('target', target):
+            self._invalidate(self._geom.dial_rect)
         
     def set_drone_home(self, home):
         """Set the home direction.
@@ -769,11 +1158,8 @@ class RotationDialWidget(QWidget):
         Args:
             home: Home direction in degrees or None
         """
-        if home is not None:
-            self._drone_home = home % 360
-        else:
-            self._drone_home = None
-        self.update()
+        if self._set_drone_status_angle('home', home):
+            self._invalidate(self._geom.dial_rect)
         
     def set_drone_wind(self, wind):
         """Set the wind direction.
@@ -781,11 +1167,8 @@ class RotationDialWidget(QWidget):
         Args:
             wind: Wind direction in degrees or None
         """
-        if wind is not None:
-            self._drone_wind = wind % 360
-        else:
-            self._drone_wind = None
-        self.update()
+        if self._set_drone_status_angle('wind', wind):
+            self._invalidate(self._geom.dial_rect)
         
     def set_drone_velocity(self, velocity):
         """Set the drone velocity vector direction.
@@ -793,11 +1176,8 @@ class RotationDialWidget(QWidget):
         Args:
             velocity: Velocity vector direction in degrees or None
         """
-        if velocity is not None:
-            self._drone_velocity = velocity % 360
-        else:
-            self._drone_velocity = None
-        self.update()
+        if self._set_drone_status_angle('velocity', velocity):
+            self._invalidate(self._geom.dial_rect)
         
     def set_drone_acceleration(self, acceleration):
         """Set the drone acceleration vector direction.
@@ -805,11 +1185,8 @@ class RotationDialWidget(QWidget):
         Args:
             acceleration: Acceleration vector direction in degrees or None
         """
-        if acceleration is not None:
-            self._drone_acceleration = acceleration % 360
-        else:
-            self._drone_acceleration = None
-        self.update()
+        if self._set_drone_status_angle('acceleration', acceleration):
+            self._invalidate(self._geom.dial_rect)
         
     def set_drone_gps_direction(self, gps):
         """Set the GPS direction to destination.
@@ -817,11 +1194,8 @@ class RotationDialWidget(QWidget):
         Args:
             gps: GPS direction in degrees or None
         """
-        if gps is not None:
-            self._drone_gps_direction = gps % 360
-        else:
-            self._drone_gps_direction = None
-        self.update()
+        if self._set_drone_status_angle('gps', gps):
+            self._invalidate(self._geom.dial_rect)
         
     def set_drone_obstacle(self, obstacle):
         """Set the direction of nearest obstacle.
@@ -829,11 +1203,8 @@ class RotationDialWidget(QWidget):
         Args:
             obstacle: Obstacle direction in degrees or None
         """
-        if obstacle is not None:
-            self._drone_obstacle = obstacle % 360
-        else:
-            self._drone_obstacle = None
-        self.update()
+        if self._set_drone_status_angle('obstacle', obstacle):
+            self._invalidate(self._geom.dial_rect)
         
     def set_drone_custom_direction(self, direction, label=None):
         """Set a custom direction indicator.
@@ -842,15 +1213,11 @@ class RotationDialWidget(QWidget):
             direction: Custom direction in degrees or None
             label: Optional label for this direction
         """
-        if direction is not None:
-            self._drone_custom_direction = direction % 360
-        else:
-            self._drone_custom_direction = None
-            
         if label:
-            self._drone_status_colors['custom'] = label
+            self._drone_custom_direction_label = label
             
-        self.update()
+        if self._set_drone_status_angle('custom', direction):
+            self._invalidate(self._geom.dial_rect)
         
     def set_drone_altitude(self, altitude):
         """Set the drone altitude.
@@ -858,8 +1225,10 @@ class RotationDialWidget(QWidget):
         Args:
             altitude: Altitude in meters or None
         """
+        changed = self._value_text_changed(self._drone_altitude, altitude)
         self._drone_altitude = altitude
-        self.update()
+        if changed:
+            self._invalidate(self._geom.status_box_rect)
         
     def set_drone_ground_speed(self, speed):
         """Set the drone ground speed.
@@ -867,8 +1236,10 @@ class RotationDialWidget(QWidget):
         Args:
             speed: Ground speed in m/s or None
         """
+        changed = self._value_text_changed(self._drone_ground_speed, speed)
         self._drone_ground_speed = speed
-        self.update()
+        if changed:
+            self._invalidate(self._geom.status_box_rect)
         
     def set_drone_vertical_speed(self, speed):
         """Set the drone vertical speed.
@@ -876,8 +1247,10 @@ class RotationDialWidget(QWidget):
         Args:
             speed: Vertical speed in m/s or None
         """
+        changed = self._value_text_changed(self._drone_vertical_speed, speed)
         self._drone_vertical_speed = speed
-        self.update()
+        if changed:
+            self._invalidate(self._geom.status_box_rect)
         
     def set_drone_battery_level(self, level):
         """Set the drone battery level.
@@ -885,8 +1258,10 @@ class RotationDialWidget(QWidget):
         Args:
             level: Battery percentage (0-100) or None
         """
+        changed = self._value_text_changed(self._drone_battery_level, level)
         self._drone_battery_level = level
-        self.update()
+        if changed:
+            self._invalidate(self._geom.status_box_rect)
         
     def set_drone_distance_to_home(self, distance):
         """Set the distance to home.
@@ -894,8 +1269,10 @@ class RotationDialWidget(QWidget):
         Args:
             distance: Distance in meters or None
         """
+        changed = self._value_text_changed(self._drone_distance_to_home, distance)
         self._drone_distance_to_home = distance
-        self.update()
+        if changed:
+            self._invalidate(self._geom.status_box_rect)
         
     def set_drone_custom_value(self, value, label=None):
         """Set a custom numeric value.
@@ -904,10 +1281,13 @@ class RotationDialWidget(QWidget):
             value: Custom numeric value or None
             label: Optional label for this value
         """
+        changed = self._value_text_changed(self._drone_custom_value, value)
         self._drone_custom_value = value
-        if label:
+        if label and label != self._drone_custom_label:
             self._drone_custom_label = label
-        self.update()
+            changed = True
+        if changed:
+            self._invalidate(self._geom.status_box_rect)
         
     def set_show_numeric_values(self, show):
         """Set whether to show numeric status values.
@@ -915,8 +1295,10 @@ class RotationDialWidget(QWidget):
         Args:
             show: Whether to show numeric values
         """
+        if show == self._show_numeric_values:
+            return
         self._show_numeric_values = show
-        self.update()
+        self._invalidate(self._geom.status_box_rect)
         
     def set_numeric_precision(self, precision):
         """Set decimal precision for numeric values.
@@ -924,8 +1306,11 @@ class RotationDialWidget(QWidget):
         Args:
             precision: Number of decimal places (0-5)
         """
-        self._numeric_precision = max(0, min(5, precision))
-        self.update()
+        precision = max(0, min(5, precision))
+        if precision == self._numeric_precision:
+            return
+        self._numeric_precision = precision
+        self._invalidate(self._geom.status_box_rect)
         
 
 class RotationParameter(Parameter):
@@ -982,6 +1367,10 @@ class RotationParameter(Parameter):
         self.snap_enabled = self.config.get('snap', False)
         self.snap_angles = self.config.get('snap_angles', [0, 90, 180, 270])
         self.snap_threshold = self.config.get('snap_threshold', 5.0)
+        # Each snap angle with its 0-359 equivalent, so a lookup needs a
+        # single distance per candidate
+        self._snap_lookup = tuple((snap_angle % 360, snap_angle)
+                                  for snap_angle in self.snap_angles)
         
         # Set zero orientation
         if 'zero_orientation' in self.config:
@@ -1023,27 +1412,24 @@ class RotationParameter(Parameter):
         """
         # Apply snapping if enabled
         if self.snap_enabled:
-            # Find the closest snap angle
-            closest_angle = min(self.snap_angles, 
-                               key=lambda snap_angle: min(
-                                   abs(angle - snap_angle),
-                                   abs(angle - snap_angle - 360),
-                                   abs(angle - snap_angle + 360)
-                               ))
+            # Find the closest snap angle, measuring the short way around the circle
+            closest_angle = None
+            min_diff = 360.0
+            for normalized, snap_angle in self._snap_lookup:
+                diff = abs(angle - normalized)
+                if diff > 180:
+                    diff = 360 - diff
+                if diff < min_diff:
+                    min_diff = diff
+                    closest_angle = snap_angle
             
             # Check if within threshold
-            min_diff = min(
-                abs(angle - closest_angle),
-                abs(angle - closest_angle - 360),
-                abs(angle - closest_angle + 360)
-            )
-            
-            if min_diff <= self.snap_threshold:
+            if closest_angle is not None and min_diff <= self.snap_threshold:
                 angle = closest_angle
                 self.rotation_dial.set_angle(angle)
         
         self.value = angle
-        self.valueChanged.emit(self.name, self.value)
+        self._emit_value(self.value)
     
     def set_value(self, value, trigger_callback=True):
         """Set the parameter value programmatically.
@@ -1057,7 +1443,7 @@ class RotationParameter(Parameter):
         self.rotation_dial.set_angle(angle)
         
         if trigger_callback:
-            self.valueChanged.emit(self.name, self.value)
+            self._emit_value(self.value)
     
     def get_value(self):
         """Get the current parameter value.
@@ -1073,12 +1459,4 @@ class RotationParameter(Parameter):
         Returns:
             The display angle in degrees
         """
-        return self.rotation_dial.get_display_angle()
-
-    def register_callback(self, callback):
-        """Register a callback function for value changes.
-        
-        Args:
-            callback: Function to call when the value changes
-        """
-        self.valueChanged.connect(callback)
\ No newline at end of file
+        return self.rotation_dial.get_display_angle()
\ No newline at end of file
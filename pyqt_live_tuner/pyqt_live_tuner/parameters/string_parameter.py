@@ -1,5 +1,5 @@
 from PyQt5.QtWidgets import QLineEdit
-from typing import Callable, Optional
+from typing import Optional
 
 from .parameter import Parameter
 
@@ -37,8 +37,8 @@ class StringParameter(Parameter):
         self.line_edit.setPlaceholderText(placeholder)
         self.line_edit.editingFinished.connect(self.on_text_changed)
 
-        # Add to existing layout from base class
-        self.layout.addWidget(self.line_edit)
+        # Add to the content layout from the base class
+        self.working_layout.addWidget(self.line_edit)
 
     def on_text_changed(self) -> None:
         """Handle text change events from the line edit.
@@ -48,7 +48,7 @@ class StringParameter(Parameter):
         value = self.line_edit.text()
         if value != self.value:
             self.value = value
-            self.valueChanged.emit(self.name, value)
+            self._emit_value(value)
 
     def set_value(self, value: str) -> None:
         """Set the parameter value programmatically.
@@ -60,7 +60,7 @@ class StringParameter(Parameter):
         """
         self.value = value
         self.line_edit.setText(value)
-        self.valueChanged.emit(self.name, value)
+        self._emit_value(value)
 
     def get_value(self) -> str:
         """Get the current parameter value.
@@ -69,12 +69,3 @@ class StringParameter(Parameter):
             The current string value of the parameter
         """
         return self.line_edit.text()
-
-    def register_callback(self, callback: Callable[[str, str], None]) -> None:
-        """Register a callback to be called when the value changes.
-        
-        Args:
-            callback: Function to call when value changes, with signature:
-                     callback(parameter_name, parameter_value)
-        """
-        self.valueChanged.connect(callback)
@@ -0,0 +1,94 @@
+"""
+Industrial-level test suite for the DropdownParameter class.
+
+This module tests repopulating the dropdown through update_options, which
+emits valueChanged only when the selection actually changes.
+"""
+import pytest
+
+from pyqt_live_tuner.parameters.dropdown_parameter import DropdownParameter
+
+
+def _make_dropdown():
+    """Create a dropdown with "B" selected and record its emitted values."""
+    param = DropdownParameter("Mode", {"options": ["A", "B", "C"], "initial": "B"})
+    emitted = []
+    param.valueChanged.connect(lambda name, value: emitted.append(value))
+    return param, emitted
+
+
+class TestDropdownUpdateOptions:
+    """Test suite for DropdownParameter.update_options."""
+
+    def test_kept_selection_does_not_emit(self, qapp):
+        """
+        Test new options that still contain the current selection.
+
+        Verifies:
+        - The selection is kept
+        - valueChanged is not emitted
+        """
+        # Arrange
+        param, emitted = _make_dropdown()
+
+        # Act
+        param.update_options(["B", "D"])
+
+        # Assert
+        assert param.get_value() == "B"
+        assert param.dropdown.currentText() == "B"
+        assert emitted == []
+
+    def test_removed_selection_emits_once(self, qapp):
+        """
+        Test new options that no longer contain the current selection.
+
+        Verifies:
+        - The dropdown falls back to the placeholder, whose value is ""
+        - valueChanged is emitted exactly once
+        """
+        # Arrange
+        param, emitted = _make_dropdown()
+
+        # Act
+        param.update_options(["C", "D"])
+
+        # Assert
+        assert param.get_value() == ""
+        assert param.dropdown.currentIndex() == 0
+        assert emitted == [""]
+
+    def test_new_initial_emits_once(self, qapp):
+        """
+        Test passing a different initial selection with the new options.
+
+        Verifies:
+        - The initial option is selected
+        - valueChanged is emitted exactly once with it
+        """
+        # Arrange
+        param, emitted = _make_dropdown()
+
+        # Act
+        param.update_options(["B", "D"], initial="D")
+
+        # Assert
+        assert param.get_value() == "D"
+        assert emitted == ["D"]
+
+    def test_setting_placeholder_clears_value(self, qapp):
+        """
+        Test selecting the placeholder through set_value.
+
+        Verifies:
+        - The value is "", not the placeholder text
+        """
+        # Arrange
+        param, _ = _make_dropdown()
+
+        # Act
+        param.set_value(param.placeholder)
+
+        # Assert
+        assert param.get_value() == ""
+        assert param.dropdown.currentIndex() == 0
@@ -0,0 +1,150 @@
+"""
+Industrial-level test suite for the JoystickWidget class.
+
+This module tests the shared update timer that drives pressed joysticks,
+which emits each widget's position at its own update frequency, along with
+duplicate-emit suppression and keyboard control.
+"""
+import pytest
+
+from PyQt5 import sip
+from PyQt5.QtCore import QEvent, Qt
+from PyQt5.QtGui import QFocusEvent
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication
+
+from pyqt_live_tuner.parameters.joystick_parameter import JoystickWidget
+
+
+def _press_and_count_updates(widget):
+    """Start continuous updates on a widget and count its periodic updates."""
+    counts = []
+    emit_position = widget._emit_position
+
+    def counting_emit_position():
+        counts.append(1)
+        emit_position()
+
+    widget._emit_position = counting_emit_position
+    widget._pressed = True
+    widget._start_updates()
+    return counts
+
+
+class TestJoystickUpdateTimer:
+    """Test suite for the timer shared by pressed joysticks."""
+
+    def test_each_widget_keeps_its_own_frequency(self, qapp):
+        """
+        Test two pressed joysticks with different update frequencies.
+
+        Verifies:
+        - The slower joystick is not updated at the faster one's rate
+        - The faster joystick still gets its full rate
+        """
+        # Arrange
+        slow = JoystickWidget()
+        slow.set_update_frequency(5)
+        fast = JoystickWidget()
+        fast.set_update_frequency(50)
+        slow.show()
+        fast.show()
+
+        # Act
+        slow_counts = _press_and_count_updates(slow)
+        fast_counts = _press_and_count_updates(fast)
+        QTest.qWait(1000)
+        slow._stop_updates()
+        fast._stop_updates()
+
+        # Assert
+        assert 3 <= len(slow_counts) <= 6
+        assert 35 <= len(fast_counts) <= 52
+
+    def test_deleted_timer_is_recreated(self, qapp):
+        """
+        Test that a shared timer deleted with its QApplication is replaced.
+
+        Verifies:
+        - Stopping updates after the timer was deleted doesn't raise
+        - Starting updates again runs on a new, active timer
+        """
+        # Arrange
+        widget = JoystickWidget()
+        widget.show()
+        widget._pressed = True
+        widget._start_updates()
+        sip.delete(JoystickWidget._tick_timer)
+
+        # Act
+        widget._stop_updates()
+        widget._start_updates()
+
+        # Assert
+        timer = JoystickWidget._tick_timer
+        assert not sip.isdeleted(timer)
+        assert timer.isActive()
+        widget._stop_updates()
+
+
+class TestJoystickEmitDedupe:
+    """Test suite for dropping positionChanged emits that repeat the last position."""
+
+    def test_changes_below_epsilon_are_not_emitted(self, qapp):
+        """
+        Test programmatic moves smaller and larger than the emit threshold.
+
+        Verifies:
+        - The first position is always emitted
+        - A move of less than 1e-4 on both axes is not emitted
+        - A move of more than 1e-4 on either axis is emitted
+        """
+        # Arrange
+        widget = JoystickWidget()
+        emitted = []
+        widget.positionChanged.connect(lambda x, y: emitted.append((x, y)))
+
+        # Act
+        widget.set_position(0.5, 0.5)
+        widget.set_position(0.50005, 0.5)
+        widget.set_position(0.5, 0.50005)
+        widget.set_position(0.5, 0.5002)
+
+        # Assert
+        assert emitted == [(0.5, 0.5), (0.5, 0.5002)]
+
+
+class TestJoystickKeyboard:
+    """Test suite for keyboard control of the joystick."""
+
+    def test_focus_out_releases_held_keys(self, qapp):
+        """
+        Test losing focus while a stick key is held down.
+
+        Verifies:
+        - Pressing a stick key emits at once and starts the update timer
+        - Losing focus clears the held keys and stops the update timer
+        - The next key press is treated as a fresh press and emits again
+        """
+        # Arrange
+        widget = JoystickWidget()
+        widget.show()
+        QTest.qWaitForWindowExposed(widget)
+        emitted = []
+        widget.positionChanged.connect(lambda x, y: emitted.append((x, y)))
+        QTest.keyPress(widget, Qt.Key_Left)
+        assert emitted == [(-0.1, 0.0)]
+        assert widget._updates_active()
+
+        # Act
+        QApplication.sendEvent(widget, QFocusEvent(QEvent.FocusOut))
+
+        # Assert
+        assert not widget._keys_down
+        assert not widget._pressed_via_key
+        assert not widget._updates_active()
+
+        QTest.keyPress(widget, Qt.Key_Left)
+        assert len(emitted) == 2
+        assert emitted[-1] == pytest.approx((-0.2, 0.0))
+        QTest.keyRelease(widget, Qt.Key_Left)
@@ -0,0 +1,112 @@
+"""
+Industrial-level test suite for the ParameterGroup and LinkedParameterGroup classes.
+
+This module tests applying values to a group through set_values, both for
+partial updates and for names that are not parameters of the group.
+"""
+import pytest
+
+from pyqt_live_tuner.groups.parameter_group import ParameterGroup
+from pyqt_live_tuner.groups.linked_parameter_group import LinkedParameterGroup
+from pyqt_live_tuner.parameters.bool_parameter import BoolParameter
+from pyqt_live_tuner.parameters.float_parameter import FloatParameter
+
+
+def _populate(group):
+    """Add a float and a bool parameter to a group."""
+    group.add_parameters([
+        FloatParameter("Gain", {"min": 0.0, "max": 10.0, "initial": 1.0}),
+        BoolParameter("Enabled", {"initial": False}),
+    ])
+    return group
+
+
+class TestParameterGroupSetValues:
+    """Test suite for ParameterGroup.set_values."""
+
+    def test_partial_update(self, qapp):
+        """
+        Test setting the values of some of the group's parameters.
+
+        Verifies:
+        - The named parameter takes the new value
+        - Parameters left out of the update keep their values
+        """
+        # Arrange
+        group = _populate(ParameterGroup("Group"))
+
+        # Act
+        group.set_values({"Gain": 2.5})
+
+        # Assert
+        assert group.get_values() == {"Gain": 2.5, "Enabled": False}
+
+    def test_unknown_name_raises(self, qapp):
+        """
+        Test setting a value for a name that isn't in the group.
+
+        Verifies:
+        - A ValueError is raised that names every unknown key
+        - No value is applied when any key is unknown
+        """
+        # Arrange
+        group = _populate(ParameterGroup("Group"))
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="Missing, Other"):
+            group.set_values({"Gain": 2.5, "Other": 1, "Missing": True})
+        assert group.get_values() == {"Gain": 1.0, "Enabled": False}
+
+    def test_full_update_does_not_raise(self, qapp):
+        """
+        Test setting the values of every parameter in the group.
+
+        Verifies:
+        - A complete, valid update is applied without raising
+        """
+        # Arrange
+        group = _populate(ParameterGroup("Group"))
+
+        # Act
+        group.set_values({"Gain": 3.0, "Enabled": True})
+
+        # Assert
+        assert group.get_values() == {"Gain": 3.0, "Enabled": True}
+
+
+class TestLinkedParameterGroupSetValues:
+    """Test suite for LinkedParameterGroup.set_values."""
+
+    def test_partial_update(self, qapp):
+        """
+        Test setting the values of some of the linked group's parameters.
+
+        Verifies:
+        - The named parameter takes the new value
+        - Parameters left out of the update keep their values
+        """
+        # Arrange
+        group = _populate(LinkedParameterGroup("Linked"))
+
+        # Act
+        group.set_values({"Enabled": True})
+
+        # Assert
+        assert group.get_values() == {"Gain": 1.0, "Enabled": True}
+
+    def test_unknown_name_is_ignored(self, qapp):
+        """
+        Test setting a value for a name that isn't in the linked group.
+
+        Verifies:
+        - Unknown names are skipped without raising
+        - Known names in the same update are still applied
+        """
+        # Arrange
+        group = _populate(LinkedParameterGroup("Linked"))
+
+        # Act
+        group.set_values({"Gain": 4.0, "Other": 1})
+
+        # Assert
+        assert group.get_values() == {"Gain": 4.0, "Enabled": False}
@@ -0,0 +1,106 @@
+"""
+Industrial-level test suite for the RotationDialWidget class.
+
+This module tests how angle limits are applied, including ranges that
+wrap through 0 degrees.
+"""
+import pytest
+
+from pyqt_live_tuner.parameters.rotation_parameter import RotationDialWidget, _clamp_wrapped
+
+
+class TestClampWrapped:
+    """Test suite for clamping angles to the dial's allowed range."""
+
+    @pytest.mark.parametrize("angle, expected", [
+        (100, 100),
+        (0, 0),
+        (200, 200),
+        (250, 200),
+        (359, 0),
+        (300, 0),
+    ])
+    def test_normal_range(self, angle, expected):
+        """
+        Test clamping to a range that doesn't wrap (0 to 200).
+
+        Verifies:
+        - Angles inside the range, limits included, are unchanged
+        - Angles outside go to the limit nearest the short way around,
+          so 359 clamps to 0 rather than to 200
+        """
+        # Act / Assert
+        assert _clamp_wrapped(angle, 0, 200) == expected
+
+    @pytest.mark.parametrize("angle, expected", [
+        (350, 350),
+        (10, 10),
+        (330, 330),
+        (30, 30),
+        (100, 30),
+        (200, 330),
+    ])
+    def test_wrapped_range(self, angle, expected):
+        """
+        Test clamping to a range that wraps through 0 (330 to 30).
+
+        Verifies:
+        - Angles on either side of 0 inside the range are unchanged
+        - Angles outside go to the nearest limit
+        """
+        # Act / Assert
+        assert _clamp_wrapped(angle, 330, 30) == expected
+
+    def test_limits_are_normalized(self):
+        """
+        Test limits given outside 0-359.
+
+        Verifies:
+        - Limits are taken modulo 360 before clamping
+        """
+        # Act / Assert
+        assert _clamp_wrapped(100, -30, 30) == 30
+        assert _clamp_wrapped(350, -30, 390) == 350
+
+
+class TestRotationDialLimits:
+    """Test suite for angle limits on RotationDialWidget."""
+
+    def test_set_angle_is_clamped(self, qapp):
+        """
+        Test setting an angle outside the dial's limits.
+
+        Verifies:
+        - The stored angle is the clamped one
+        - angleChanged reports the clamped angle
+        """
+        # Arrange
+        dial = RotationDialWidget()
+        dial.set_angle_limits(0, 200)
+        dial.set_angle(100)
+        emitted = []
+        dial.angleChanged.connect(emitted.append)
+
+        # Act
+        dial.set_angle(-1)
+
+        # Assert
+        assert dial.get_angle() == 0
+        assert emitted == [0]
+
+    def test_setting_limits_clamps_current_angle(self, qapp):
+        """
+        Test narrowing the limits so the current angle falls outside them.
+
+        Verifies:
+        - The current angle moves to the nearest new limit
+        """
+        # Arrange
+        dial = RotationDialWidget()
+        dial.set_angle(100)
+
+        # Act
+        dial.set_angle_limits(330, 30)
+
+        # Assert
+        assert dial.get_angle() == 30